@@ -1,14 +0,0 @@
-import asyncio
-import traceback
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from src.core.config import settings
-from src.services import BookService
-
-async def test():
-    try:
-        engine = create_async_engine(settings.database_url)
-        async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-        
-        async with async_session() as session:
-            print(Calling
\ No newline at end of file
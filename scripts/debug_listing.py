@@ -0,0 +1,30 @@
+"""
+Print the first page of books for debugging.
+
+Uses the application's own session factory so it shares the configured
+engine instead of opening a second connection pool.
+
+Usage:
+    python -m scripts.debug_listing
+"""
+
+import asyncio
+
+from src.core import async_session_maker, close_db
+from src.services import BookService
+
+
+async def main() -> None:
+    """List the first page of books with their average rating."""
+    try:
+        async with async_session_maker() as session:
+            books, total = await BookService.get_all_books(session)
+            print(f"{total} books total")
+            for book in books:
+                print(f"{book.id}: {book.title} by {book.author} (avg rating: {book.average_rating})")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
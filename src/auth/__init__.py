@@ -5,20 +5,29 @@ This module provides utilities for JWT token creation, validation,
 and password hashing using bcrypt.
 """
 
-from datetime import datetime, timedelta
+import hashlib
+import sys
+import threading
+import time
 from typing import Optional, Tuple
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import bcrypt
+from cachetools import TLRUCache
+import jwt
+from jwt.exceptions import InvalidTokenError as JWTError
+from fastapi import Depends, Header, HTTPException, status
 
 from src.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__truncate_error=False)
-
-# HTTP Bearer security scheme
-security = HTTPBearer()
+# Verified token payloads keyed by a truncated SHA-256 of the token, so raw
+# bearer tokens are never retained. Entries live at most TOKEN_CACHE_TTL
+# seconds and never outlive the token's own ``exp`` claim.
+TOKEN_CACHE_TTL = 60
+_token_cache = TLRUCache(
+    maxsize=10000,
+    ttu=lambda _key, payload, now: min(now + TOKEN_CACHE_TTL, payload.get("exp", now)),
+    timer=time.time,
+)
+_token_cache_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
@@ -31,7 +40,8 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -45,7 +55,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
 def create_tokens(user_id: int, username: str, role: str) -> Tuple[str, str]:
@@ -60,13 +70,16 @@ def create_tokens(user_id: int, username: str, role: str) -> Tuple[str, str]:
     Returns:
         Tuple of (access_token, refresh_token)
     """
+    now = int(time.time())
+
     # Access token
     access_payload = {
         "sub": str(user_id),
         "username": username,
         "role": role,
         "type": "access",
-        "exp": datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes),
+        "iat": now,
+        "exp": now + settings.access_token_expire_minutes * 60,
     }
     access_token = jwt.encode(
         access_payload,
@@ -79,7 +92,8 @@ def create_tokens(user_id: int, username: str, role: str) -> Tuple[str, str]:
         "sub": str(user_id),
         "username": username,
         "type": "refresh",
-        "exp": datetime.utcnow() + timedelta(days=settings.refresh_token_expire_days),
+        "iat": now,
+        "exp": now + settings.refresh_token_expire_days * 86400,
     }
     refresh_token = jwt.encode(
         refresh_payload,
@@ -103,13 +117,18 @@ def verify_token(token: str) -> dict:
     Raises:
         HTTPException: If token is invalid or expired
     """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
     try:
         payload = jwt.decode(
             token,
             settings.secret_key,
             algorithms=[settings.algorithm]
         )
-        return payload
     except JWTError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -117,50 +136,99 @@ def verify_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+    if "role" in payload:
+        payload["role"] = sys.intern(payload["role"])
+
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
+
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+def _bearer_token(authorization: Optional[str]) -> str:
+    """
+    Extract the token from an ``Authorization: Bearer <token>`` header.
+
+    Args:
+        authorization: Raw Authorization header value
+
+    Returns:
+        The bearer token
+
+    Raises:
+        HTTPException: If the header is missing or not a Bearer credential
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if not token or scheme.lower() != "bearer":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
+
+async def get_current_user(
+    authorization: Optional[str] = Header(None, include_in_schema=False),
+) -> dict:
     """
     Dependency for getting current authenticated user.
 
+    Parses the ``Authorization: Bearer <token>`` header directly instead of
+    going through ``HTTPBearer`` and its credentials model.
+
     Args:
-        credentials: HTTP credentials from request
+        authorization: Raw Authorization header value
 
     Returns:
         Decoded token payload with user information
 
     Raises:
-        HTTPException: If authentication fails
+        HTTPException: If the header is missing/malformed or the token is invalid
     """
-    return verify_token(credentials.credentials)
+    return verify_token(_bearer_token(authorization))
 
 
-def get_current_user_id(current_user: dict = Depends(get_current_user)) -> int:
+async def get_current_user_id(
+    authorization: Optional[str] = Header(None, include_in_schema=False),
+) -> int:
     """
-    Extract and return user ID from current user.
+    Dependency for getting only the current user's ID.
+
+    Reads the header itself rather than depending on ``get_current_user``,
+    so endpoints that only need the ID resolve a single dependency.
 
     Args:
-        current_user: Current authenticated user from dependency
+        authorization: Raw Authorization header value
 
     Returns:
         User ID
+
+    Raises:
+        HTTPException: If the header is missing/malformed or the token is invalid
     """
-    return int(current_user.get("sub"))
+    return int(verify_token(_bearer_token(authorization))["sub"])
 
 
 def require_role(required_role: str):
     """
     Dependency factory for role-based access control.
 
+    The dependency is a coroutine function on purpose: FastAPI awaits async
+    dependencies inline, while plain ``def`` dependencies are dispatched to
+    the threadpool. The same applies to ``get_current_user`` and
+    ``get_current_user_id``, which do no I/O.
+
     Args:
         required_role: Required role to access resource
 
     Returns:
         Dependency function
     """
+    allowed_roles = frozenset({sys.intern(required_role), "admin"})
+
     async def check_role(current_user: dict = Depends(get_current_user)) -> dict:
         """Check if user has required role."""
-        user_role = current_user.get("role")
-        if user_role != required_role and user_role != "admin":
+        if current_user.get("role") not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions"
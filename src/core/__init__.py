@@ -1,14 +1,16 @@
 """Core module initialization."""
 
-from src.core.config import settings
-from src.core.database import engine, async_session_maker, Base, get_db, init_db, close_db
+from src.core.config import settings, get_settings
+from src.core.database import engine, async_session_maker, Base, get_db, fetch_page, init_db, close_db
 
 __all__ = [
     "settings",
+    "get_settings",
     "engine",
     "async_session_maker",
     "Base",
     "get_db",
+    "fetch_page",
     "init_db",
     "close_db",
 ]
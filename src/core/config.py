@@ -5,6 +5,7 @@ This module handles all configuration settings for the book management system,
 including database credentials, JWT settings, and API configuration.
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from typing import Optional
@@ -32,17 +33,28 @@ class Settings(BaseSettings):
     database_url: str = Field(..., description="Async PostgreSQL database URL")
     database_sync_url: str = Field(..., description="Synchronous PostgreSQL database URL for Alembic migrations")
     database_echo: bool = Field(default=False, description="Log SQL queries")
+    db_pool_size: int = Field(default=20, description="Number of persistent database connections")
+    db_max_overflow: int = Field(default=20, description="Extra connections allowed beyond the pool size")
 
     # JWT Configuration
     secret_key: str = Field(..., min_length=32, description="Secret key for JWT token signing")
     algorithm: str = Field(default="HS256", description="JWT algorithm")
     access_token_expire_minutes: int = Field(default=30, description="Access token expiration time in minutes")
     refresh_token_expire_days: int = Field(default=7, description="Refresh token expiration time in days")
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31, description="Bcrypt cost factor for password hashing")
 
     # Groq/LLM Configuration
     groq_api_key: str = Field(..., description="Groq API key for LLM integration")
     llm_model: str = Field(default="llama-3.3-70b-versatile", description="LLM model to use")
     max_tokens: int = Field(default=1024, description="Maximum tokens for LLM generation")
+    review_summary_cache_ttl: int = Field(default=3600, description="Seconds a generated review summary is served from cache")
+    llm_cache_size: int = Field(default=1024, description="Maximum number of LLM completions kept in memory")
+    llm_cache_ttl: int = Field(default=86400, description="Seconds a cached summary completion is reused")
+    llm_recommendation_cache_ttl: int = Field(default=900, description="Seconds a cached recommendation completion is reused")
+    llm_max_concurrency: int = Field(default=8, description="Maximum concurrent Groq API calls per process")
+    max_content_chars: int = Field(default=8000, description="Characters of book content included in a summary prompt")
+    llm_timeout: float = Field(default=30.0, description="Seconds before a Groq API call times out")
+    llm_max_retries: int = Field(default=2, description="Retries for failed Groq API calls")
 
     # CORS Configuration
     cors_origins: list = Field(
@@ -61,5 +73,16 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, constructing them only once.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -5,20 +5,55 @@ This module provides database connectivity using SQLAlchemy async engine
 and session factory for the application.
 """
 
+import asyncio
+
+from sqlalchemy import event, func, select, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
 
+# SQLite (used for local runs and tests) manages its own pool; pool sizing
+# only applies to server databases. Size the pool per worker process: the
+# database sees workers * (db_pool_size + db_max_overflow) connections at
+# peak, so db_pool_size should cover one worker's expected concurrent
+# requests. LIFO checkout keeps a small set of connections hot so idle
+# extras can be recycled.
+_is_sqlite = settings.database_url.startswith("sqlite")
+
+_engine_options = {}
+if not _is_sqlite:
+    _engine_options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
+    if settings.database_url.startswith("postgresql+asyncpg"):
+        # Keep each connection's prepared statements across requests so
+        # Postgres parses/plans the hot queries once per connection.
+        _engine_options["connect_args"] = {"prepared_statement_cache_size": 500}
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.database_echo,
-    poolclass=NullPool,
     future=True,
+    # Compiled SQL for the statement shapes the services build repeatedly
+    query_cache_size=1200,
+    **_engine_options,
 )
 
+if _is_sqlite:
+    # SQLite ignores foreign keys unless asked per connection; review inserts
+    # rely on the books FK to reject unknown book IDs.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 # Create async session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -34,21 +69,62 @@ async def get_db() -> AsyncSession:
     """
     Dependency for getting database session in FastAPI routes.
 
+    One session is shared by every statement in a request. Services commit
+    their own writes so the transaction is durable before the response is
+    sent; FastAPI runs dependency teardown only after the response.
+
     Yields:
         AsyncSession: Database session for the request.
     """
     async with async_session_maker() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
+
+
+async def fetch_page(session: AsyncSession, query, skip: int, limit: int) -> tuple[list, int]:
+    """
+    Fetch one page of ``query`` together with the total match count.
+
+    The total rides along on every row as ``count(*) OVER ()``, so page and
+    count arrive in one round trip on one connection. Only when the page is
+    empty past the first offset (no row to carry the total) is a separate
+    COUNT issued.
+
+    Args:
+        session: Database session
+        query: ``select()`` of a single entity, with filters and options
+        skip: Number of records to skip
+        limit: Number of records to fetch
+
+    Returns:
+        Tuple of (entities list, total count)
+    """
+    stmt = query.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if skip == 0:
+        return [], 0
+
+    total = await session.scalar(select(func.count()).select_from(query.subquery()))
+    return [], total or 0
 
 
 async def init_db():
-    """Initialize database tables."""
+    """Initialize database tables and pre-warm the connection pool."""
     async with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            # Needed by the trigram indexes on books
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
 
+    if not _is_sqlite:
+        # Open pool_size connections up front so the first burst of requests
+        # doesn't stampede the database with concurrent connects.
+        connections = await asyncio.gather(
+            *(engine.connect() for _ in range(settings.db_pool_size))
+        )
+        await asyncio.gather(*(conn.close() for conn in connections))
+
 
 async def close_db():
     """Close database connections."""
@@ -2,15 +2,21 @@
 Main FastAPI application initialization and configuration.
 
 This module sets up the FastAPI application with routes,
-middleware, and startup/shutdown events.
+middleware, and a lifespan handler for startup/shutdown.
 """
 
 import logging
-from fastapi import FastAPI
+import re
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse, Response
 
 from src.core import settings, init_db, close_db
+from src.utils import llm_service
 from src.routes import (
     auth_router,
     book_router,
@@ -25,16 +31,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from contextlib import asynccontextmanager
-from fastapi import Request, status
-from fastapi.responses import JSONResponse
-from fastapi.exceptions import RequestValidationError
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for application startup and shutdown.
-    Handles database initialization and connection cleanup.
+    Handles database initialization and connection cleanup, and closes
+    the LLM client's connections on shutdown.
     """
     # Startup
     logger.info("Starting up application...")
@@ -54,6 +57,7 @@ async def lifespan(app: FastAPI):
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error closing database: {str(e)}")
+    await llm_service.close()
 
 # Create FastAPI application
 app = FastAPI(
@@ -63,6 +67,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -72,7 +77,7 @@ app = FastAPI(
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Global handler for validation errors."""
     logger.error(f"Validation error: {exc.errors()}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": exc.errors(), "message": "Validation error"},
     )
@@ -81,36 +86,59 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 async def global_exception_handler(request: Request, exc: Exception):
     """Global handler for unhandled exceptions."""
     logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error", "message": "An unexpected error occurred."},
     )
 
-# Configure CORS
+def _cors_origin_options(origins: list) -> dict:
+    """
+    Build the CORSMiddleware origin options for the configured origins.
+
+    Listed origins are matched with a single compiled regex. A "*" entry
+    allows every origin, as CORSMiddleware does for ``allow_origins=["*"]``.
+
+    Args:
+        origins: Configured CORS origins
+
+    Returns:
+        Keyword arguments for CORSMiddleware
+    """
+    if "*" in origins:
+        return {"allow_origins": ["*"]}
+    return {"allow_origin_regex": "^(" + "|".join(re.escape(o) for o in origins) + ")$"}
+
+
+# Configure CORS. The allowed headers are listed explicitly, so preflights
+# skip the "*" path that echoes back whatever headers the client requested.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    **_cors_origin_options(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"],
+    allow_headers=["Authorization", "Content-Type", "Accept"],
 )
 
 
 # ==================== Health Check ====================
 
+# The health payload never changes, so it is serialized once at import.
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "service": settings.api_title,
+    "version": settings.api_version,
+})
+
+
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns:
         Health status
     """
-    return {
-        "status": "healthy",
-        "service": settings.api_title,
-        "version": settings.api_version,
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # ==================== Route Registration ====================
@@ -124,6 +152,10 @@ app.include_router(recommendation_router)
 
 # ==================== OpenAPI Customization ====================
 
+# Paths that are served without authentication
+_UNSECURED = frozenset({"/health"})
+
+
 def custom_openapi():
     """Customize OpenAPI schema."""
     if app.openapi_schema:
@@ -148,7 +180,7 @@ def custom_openapi():
 
     # Add security requirement to all endpoints (except health check)
     for path, path_item in openapi_schema["paths"].items():
-        if path != "/health":
+        if path not in _UNSECURED:
             for operation in path_item.values():
                 if isinstance(operation, dict) and "tags" in operation:
                     operation["security"] = [{"bearerAuth": []}]
@@ -159,8 +191,26 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# Build the schema once at import and serve the pre-serialized bytes,
+# replacing FastAPI's default route which re-encodes it on every request.
+_OPENAPI_BYTES = orjson.dumps(custom_openapi())
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json() -> Response:
+    """Serve the cached OpenAPI schema."""
+    return Response(content=_OPENAPI_BYTES, media_type="application/json")
+
 
 if __name__ == "__main__":
+    # For production, prefer start.sh (gunicorn managing UvicornWorker
+    # processes). Running this module directly uses one worker per core
+    # unless debug/reload is enabled.
+    import os
     import uvicorn
 
     uvicorn.run(
@@ -168,5 +218,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        workers=1 if settings.debug else max(1, os.cpu_count() or 1),
         log_level="info",
+        loop="uvloop",
+        http="httptools",
     )
@@ -6,19 +6,23 @@ with all necessary relationships and constraints.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, Enum
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, Float, ForeignKey, Numeric,
+    Boolean, Index, CheckConstraint, func, cast, type_coerce,
+    literal_column,
+)
 from sqlalchemy.orm import relationship
 from src.core.database import Base
-import enum
 
 
-class UserRole(str, enum.Enum):
-    """User roles for RBAC."""
+class UserRole:
+    """User roles for RBAC, stored as plain strings."""
     ADMIN = "admin"
     USER = "user"
     MODERATOR = "moderator"
 
+    ALL = (ADMIN, USER, MODERATOR)
+
 
 class User(Base):
     """
@@ -39,17 +43,57 @@ class User(Base):
     username = Column(String(255), unique=True, index=True, nullable=False)
     email = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    role = Column(Enum(UserRole), default=UserRole.USER, nullable=False)
-    is_active = Column(Integer, default=1, nullable=False)
+    role = Column(String(16), default=UserRole.USER, nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
-    # Relationships
-    reviews = relationship("Review", back_populates="user", cascade="all, delete-orphan")
+    # Login looks users up by username among active accounts only
+    __table_args__ = (
+        CheckConstraint(
+            "role IN (" + ", ".join(f"'{r}'" for r in UserRole.ALL) + ")",
+            name="ck_users_role",
+        ),
+        Index(
+            "ix_users_username_active",
+            username,
+            postgresql_where=is_active.is_(True),
+            sqlite_where=is_active.is_(True),
+        ),
+    )
+
+    # Relationships. Reviews are removed by the ON DELETE CASCADE foreign
+    # key, so deleting the parent does not load them first.
+    reviews = relationship(
+        "Review", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, username={self.username}, email={self.email})>"
 
 
+def search_document(title, author):
+    """
+    Build the Postgres ``tsvector`` searched by book full-text search.
+
+    Constants are inlined rather than bound so queries compile to exactly
+    the indexed expression; a bound parameter would stop the planner from
+    matching it to the index.
+
+    Args:
+        title: Title column
+        author: Author column
+
+    Returns:
+        SQL ``to_tsvector`` expression over title and author
+    """
+    return func.to_tsvector(
+        literal_column("'simple'"),
+        func.coalesce(title, literal_column("''"))
+        .op("||")(literal_column("' '"))
+        .op("||")(func.coalesce(author, literal_column("''"))),
+    )
+
+
 class Book(Base):
     """
     Book model for storing book information.
@@ -63,6 +107,9 @@ class Book(Base):
         summary: Book summary/description
         created_at: Timestamp of book creation
         updated_at: Timestamp of last update
+        average_rating: Stored mean review rating rounded to two decimals,
+            kept current by ReviewService (None without reviews)
+        review_count: Stored number of reviews, kept current by ReviewService
     """
     __tablename__ = "books"
 
@@ -74,23 +121,42 @@ class Book(Base):
     summary = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-
-    # Relationships
-    reviews = relationship("Review", back_populates="book", cascade="all, delete-orphan")
+    # Denormalized review statistics, so ranking books by rating reads
+    # these columns instead of aggregating every review per request
+    average_rating = Column(Float, nullable=True)
+    review_count = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # Relationships. Reviews are removed by the ON DELETE CASCADE foreign
+    # key, so deleting the parent does not load them first.
+    reviews = relationship(
+        "Review", back_populates="book", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+    # Trigram GIN indexes let Postgres serve the ILIKE '%...%' filters
+    # without a sequential scan. Requires the pg_trgm extension, which
+    # init_db creates. books_search_idx backs full-text search. Other
+    # databases skip these indexes. ix_books_popular serves the popular
+    # books ranking.
+    __table_args__ = tuple(
+        Index(
+            f"books_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql")
+        for column in ("title", "author", "genre")
+    ) + (
+        Index(
+            "books_search_idx",
+            search_document(title, author),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index("ix_books_popular", average_rating.desc()),
+    )
 
     def __repr__(self) -> str:
         return f"<Book(id={self.id}, title={self.title}, author={self.author})>"
 
-    @property
-    def average_rating(self) -> Optional[float]:
-        """Calculate average rating from reviews."""
-        if 'reviews' not in self.__dict__:
-            return None
-        if not self.reviews:
-            return None
-        total = sum(review.rating for review in self.reviews)
-        return round(total / len(self.reviews), 2)
-
 
 class Review(Base):
     """
@@ -119,5 +185,50 @@ class Review(Base):
     book = relationship("Book", back_populates="reviews")
     user = relationship("User", back_populates="reviews")
 
+    # Serves a book's reviews newest first, including keyset page lookups
+    __table_args__ = (
+        Index("ix_reviews_book_id_id", book_id, id.desc()),
+    )
+
     def __repr__(self) -> str:
         return f"<Review(id={self.id}, book_id={self.book_id}, user_id={self.user_id}, rating={self.rating})>"
+
+
+class BookSummary(Base):
+    """
+    Generated book summary, stored so the same content is summarized once.
+
+    Attributes:
+        cache_key: Hash of the model, token limit and summarized content
+        summary: Generated summary text
+        created_at: Timestamp of generation
+    """
+    __tablename__ = "book_summaries"
+
+    cache_key = Column(String(64), primary_key=True)
+    summary = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<BookSummary(cache_key={self.cache_key})>"
+
+
+# Full-text search document for a book, matching the books_search_idx
+# expression so Postgres can serve search from the GIN index.
+book_search_vector = search_document(Book.__table__.c.title, Book.__table__.c.author)
+
+
+def rounded_average(rating):
+    """
+    Build a SQL average of ``rating`` rounded to two decimals.
+
+    Rounding goes through NUMERIC because Postgres has no round(float, int).
+
+    Args:
+        rating: Rating column or expression to average
+
+    Returns:
+        Float-typed SQL expression
+    """
+    return type_coerce(func.round(cast(func.avg(rating), Numeric), 2), Float)
+
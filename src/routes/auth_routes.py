@@ -9,10 +9,10 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core import get_db
+from src.core import get_db, settings
 from src.schemas import UserCreate, UserLogin, TokenResponse, UserResponse
 from src.services import UserService
-from src.auth import get_current_user
+from src.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -74,20 +74,20 @@ async def login(credentials: UserLogin, session: AsyncSession = Depends(get_db))
     return TokenResponse(
         access_token=access_token,
         refresh_token=refresh_token,
-        expires_in=30 * 60,  # 30 minutes in seconds
+        expires_in=settings.access_token_expire_minutes * 60,
     )
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: dict = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     session: AsyncSession = Depends(get_db),
 ):
     """
     Get current authenticated user's profile.
 
     Args:
-        current_user: Current authenticated user
+        user_id: Current authenticated user ID
         session: Database session
 
     Returns:
@@ -96,7 +96,6 @@ async def get_current_user_profile(
     Raises:
         HTTPException: If user not found
     """
-    user_id = int(current_user.get("sub"))
     user = await UserService.get_user_by_id(session, user_id)
 
     if not user:
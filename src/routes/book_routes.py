@@ -8,15 +8,16 @@ including retrieval, filtering, searching, and deletion.
 import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core import get_db
-from src.schemas import BookCreate, BookUpdate, BookResponse, BookDetailResponse, BookListResponse
+from src.schemas import BookCreate, BookUpdate, BookResponse, BookDetailResponse, BookListResponse, json_page
 from src.services import BookService
 from src.auth import get_current_user
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/books", tags=["Books"])
+router = APIRouter(prefix="/books", tags=["Books"], default_response_class=ORJSONResponse)
 
 
 @router.post("", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
@@ -73,13 +74,7 @@ async def get_books(
         session, skip=skip, limit=limit, genre=genre, author=author
     )
 
-    return {
-        "items": books,
-        "total": total,
-        "page": skip // limit + 1 if limit > 0 else 1,
-        "page_size": limit,
-        "total_pages": (total + limit - 1) // limit if limit > 0 else 1,
-    }
+    return json_page(BookListResponse, books, total, skip, limit)
 
 
 @router.get("/{book_id}", response_model=BookDetailResponse)
@@ -205,10 +200,4 @@ async def search_books(
         session, query, skip=skip, limit=limit
     )
 
-    return {
-        "items": books,
-        "total": total,
-        "page": skip // limit + 1 if limit > 0 else 1,
-        "page_size": limit,
-        "total_pages": (total + limit - 1) // limit if limit > 0 else 1,
-    }
+    return json_page(BookListResponse, books, total, skip, limit)
@@ -6,15 +6,17 @@ and book recommendations using LLM models.
 """
 
 import logging
+from typing import AsyncIterator
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.core import get_db
-from src.schemas import SummaryGenerateRequest, SummaryResponse, RecommendationRequest, RecommendationResponse, BookResponse
-from src.services import RecommendationService
+from src.schemas import SummaryGenerateRequest, SummaryResponse, RecommendationRequest, RecommendationResponse, BOOK_LIST_ADAPTER
+from src.services import RecommendationService, SummaryService
 from src.utils import llm_service
-from src.auth import get_current_user
+from src.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/ai", tags=["AI & Recommendations"])
@@ -23,14 +25,19 @@ router = APIRouter(prefix="/ai", tags=["AI & Recommendations"])
 @router.post("/generate-summary", response_model=SummaryResponse)
 async def generate_summary(
     request: SummaryGenerateRequest,
-    current_user: dict = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
 ):
     """
     Generate a summary for book content using LLM.
 
+    Summaries are stored by a hash of their input, so repeated requests
+    for the same content are served from the database.
+
     Args:
         request: Summary generation request data
-        current_user: Current authenticated user
+        session: Database session
+        user_id: Current authenticated user ID
 
     Returns:
         Generated summary
@@ -39,17 +46,23 @@ async def generate_summary(
         HTTPException: If summary generation fails
     """
     try:
-        summary = await llm_service.generate_summary(
-            title=request.title,
-            author=request.author,
-            content=request.content,
-            max_tokens=request.max_tokens,
+        cache_key = SummaryService.summary_key(
+            request.title, request.author, request.content, request.max_tokens
         )
+        summary = await SummaryService.get_summary(session, cache_key)
+        if summary is None:
+            summary = await llm_service.generate_summary(
+                title=request.title,
+                author=request.author,
+                content=request.content,
+                max_tokens=request.max_tokens,
+            )
+            await SummaryService.store_summary(session, cache_key, summary)
 
-        logger.info(f"Summary generated by user {current_user.get('sub')}")
+        logger.info(f"Summary generated by user {user_id}")
         return SummaryResponse(
             summary=summary,
-            generated_at=datetime.utcnow(),
+            generated_at=datetime.now(timezone.utc),
         )
     except RuntimeError as e:
         logger.error(f"Error generating summary: {str(e)}")
@@ -65,11 +78,76 @@ async def generate_summary(
         ) from e
 
 
+async def _stream_summary(request: SummaryGenerateRequest) -> AsyncIterator[str]:
+    """
+    Relay an LLM summary as it is generated.
+
+    The response has already started, so a failure ends the stream early
+    rather than changing the status code.
+
+    Args:
+        request: Summary generation request data
+
+    Yields:
+        Summary text fragments
+    """
+    try:
+        async for fragment in llm_service.stream_summary(
+            title=request.title,
+            author=request.author,
+            content=request.content,
+            max_tokens=request.max_tokens,
+        ):
+            yield fragment
+    except RuntimeError as e:
+        logger.warning(f"Could not stream summary: {str(e)}")
+
+
+@router.post("/generate-summary/stream")
+async def stream_summary(
+    request: SummaryGenerateRequest,
+    session: AsyncSession = Depends(get_db),
+    user_id: int = Depends(get_current_user_id),
+):
+    """
+    Stream a summary for book content as plain text while it is generated.
+
+    A summary already stored for the same input is sent in one piece.
+    Streamed summaries are not stored; use ``/ai/generate-summary`` for that.
+
+    Args:
+        request: Summary generation request data
+        session: Database session
+        user_id: Current authenticated user ID
+
+    Returns:
+        ``text/plain`` streaming response
+
+    Raises:
+        HTTPException: If the LLM service is not configured
+    """
+    cache_key = SummaryService.summary_key(
+        request.title, request.author, request.content, request.max_tokens
+    )
+    summary = await SummaryService.get_summary(session, cache_key)
+    if summary is not None:
+        return StreamingResponse(iter([summary]), media_type="text/plain")
+
+    if not llm_service.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM service not configured."
+        )
+
+    logger.info(f"Summary stream started by user {user_id}")
+    return StreamingResponse(_stream_summary(request), media_type="text/plain")
+
+
 @router.post("/recommendations", response_model=RecommendationResponse)
 async def get_recommendations(
     request: RecommendationRequest,
     session: AsyncSession = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """
     Get personalized book recommendations.
@@ -77,7 +155,7 @@ async def get_recommendations(
     Args:
         request: Recommendation request data
         session: Database session
-        current_user: Current authenticated user
+        user_id: Current authenticated user ID
 
     Returns:
         Recommended books with reasoning
@@ -102,11 +180,11 @@ async def get_recommendations(
             )
             criteria = "Popular books"
 
-        logger.info(f"Recommendations generated for user {current_user.get('sub')}")
+        logger.info(f"Recommendations generated for user {user_id}")
         return RecommendationResponse(
             recommendations=recommendations,
             criteria=criteria,
-            generated_at=datetime.utcnow(),
+            generated_at=datetime.now(timezone.utc),
         )
     except Exception as e:
         logger.error(f"Error getting recommendations: {str(e)}")
@@ -121,7 +199,7 @@ async def get_recommendations_by_genre(
     genre: str,
     session: AsyncSession = Depends(get_db),
     limit: int = Query(5, ge=1, le=20),
-    current_user: dict = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """
     Get book recommendations by genre.
@@ -130,7 +208,7 @@ async def get_recommendations_by_genre(
         genre: Genre to recommend books from
         session: Database session
         limit: Number of recommendations
-        current_user: Current authenticated user
+        user_id: Current authenticated user ID
 
     Returns:
         Recommended books for the genre
@@ -140,12 +218,12 @@ async def get_recommendations_by_genre(
             session, genre, limit
         )
 
-        logger.info(f"Genre recommendations generated for user {current_user.get('sub')}: {genre}")
+        logger.info(f"Genre recommendations generated for user {user_id}: {genre}")
         return {
             "genre": genre,
-        "recommendations": [BookResponse.model_validate(b) for b in recommendations],
+            "recommendations": BOOK_LIST_ADAPTER.validate_python(recommendations, from_attributes=True),
             "count": len(recommendations),
-            "generated_at": datetime.utcnow(),
+            "generated_at": datetime.now(timezone.utc),
         }
     except Exception as e:
         logger.error(f"Error getting genre recommendations: {str(e)}")
@@ -159,7 +237,7 @@ async def get_recommendations_by_genre(
 async def get_popular_books(
     session: AsyncSession = Depends(get_db),
     limit: int = Query(5, ge=1, le=20),
-    current_user: dict = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """
     Get popular book recommendations.
@@ -167,7 +245,7 @@ async def get_popular_books(
     Args:
         session: Database session
         limit: Number of recommendations
-        current_user: Current authenticated user
+        user_id: Current authenticated user ID
 
     Returns:
         Popular books
@@ -177,12 +255,12 @@ async def get_popular_books(
             session, limit
         )
 
-        logger.info(f"Popular book recommendations generated for user {current_user.get('sub')}")
+        logger.info(f"Popular book recommendations generated for user {user_id}")
         return {
             "criteria": "Popular books (highest rated with multiple reviews)",
-            "recommendations": [BookResponse.model_validate(b) for b in recommendations],
+            "recommendations": BOOK_LIST_ADAPTER.validate_python(recommendations, from_attributes=True),
             "count": len(recommendations),
-            "generated_at": datetime.utcnow(),
+            "generated_at": datetime.now(timezone.utc),
         }
     except Exception as e:
         logger.error(f"Error getting popular books: {str(e)}")
@@ -197,7 +275,7 @@ async def get_similar_books(
     book_id: int,
     session: AsyncSession = Depends(get_db),
     limit: int = Query(5, ge=1, le=20),
-    current_user: dict = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
 ):
     """
     Get books similar to a given book.
@@ -206,7 +284,7 @@ async def get_similar_books(
         book_id: Reference book ID
         session: Database session
         limit: Number of recommendations
-        current_user: Current authenticated user
+        user_id: Current authenticated user ID
 
     Returns:
         Similar books
@@ -216,7 +294,7 @@ async def get_similar_books(
     """
     try:
         from src.services import BookService
-        book = await BookService.get_book_by_id(session, book_id)
+        book = await BookService.get_book_by_id_bare(session, book_id)
         if not book:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -227,13 +305,13 @@ async def get_similar_books(
             session, book_id, limit
         )
 
-        logger.info(f"Similar book recommendations generated for user {current_user.get('sub')}")
+        logger.info(f"Similar book recommendations generated for user {user_id}")
         return {
             "reference_book": book.title,
             "criteria": f"Similar to '{book.title}' (same genre: {book.genre})",
-            "recommendations": [BookResponse.model_validate(b) for b in recommendations],
+            "recommendations": BOOK_LIST_ADAPTER.validate_python(recommendations, from_attributes=True),
             "count": len(recommendations),
-            "generated_at": datetime.utcnow(),
+            "generated_at": datetime.now(timezone.utc),
         }
     except HTTPException:
         raise
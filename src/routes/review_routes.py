@@ -6,18 +6,56 @@ and deleting book reviews.
 """
 
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import AsyncIterator, List, Optional
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core import get_db
-from src.schemas import ReviewCreate, ReviewUpdate, ReviewResponse, ReviewSummaryResponse, ReviewListResponse
+from src.core import get_db, settings
+from src.schemas import ReviewCreate, ReviewUpdate, ReviewResponse, ReviewSummaryResponse, ReviewListResponse, json_page
 from src.services import ReviewService, BookService
 from src.utils import llm_service
 from src.auth import get_current_user, get_current_user_id
-from datetime import datetime
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/books", tags=["Reviews"])
+router = APIRouter(prefix="/books", tags=["Reviews"], default_response_class=ORJSONResponse)
+
+# Generated review summaries keyed by book and review statistics, so a new
+# or changed review produces a new key. Summaries are generated in the
+# background; requests never wait on the LLM.
+_summary_cache = TTLCache(maxsize=1024, ttl=settings.review_summary_cache_ttl)
+_summary_pending = set()
+
+
+def _summary_cache_key(book_id: int, total_reviews: int, avg_rating: float) -> str:
+    """Build the summary cache key for a book's current review statistics."""
+    return f"summary:{book_id}:{total_reviews}:{round(avg_rating, 1)}"
+
+async def _regenerate_review_summary(
+    cache_key: str, book_title: str, review_texts: List[str], avg_rating: float
+) -> None:
+    """
+    Generate a review summary with the LLM and store it in the cache.
+
+    Args:
+        cache_key: Cache key for the book's current review statistics
+        book_title: Book title
+        review_texts: Review texts to summarize
+        avg_rating: Average rating of the book
+    """
+    try:
+        _summary_cache[cache_key] = await llm_service.generate_review_summary(
+            book_title, review_texts, avg_rating
+        )
+    except Exception as e:
+        logger.warning(f"Could not generate LLM summary: {str(e)}")
+    finally:
+        _summary_pending.discard(cache_key)
 
 
 @router.post("/{book_id}/reviews", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
@@ -40,24 +78,24 @@ async def create_review(
         Created review information
 
     Raises:
-        HTTPException: If book not found
+        HTTPException: If book or user not found
     """
     try:
-        # Check if book exists
-        book = await BookService.get_book_by_id(session, book_id)
-        if not book:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Book not found"
-            )
-
+        # The foreign keys reject unknown book and user IDs on insert
         review = await ReviewService.create_review(
             session, book_id, user_id, review_data
         )
         logger.info(f"Review created for book {book_id} by user {user_id}")
         return review
-    except HTTPException:
-        raise
+    except IntegrityError as e:
+        # Only the failure path pays for finding out which key was missing
+        detail = "Book not found"
+        if await BookService.exists(session, book_id):
+            detail = "User not found"
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail
+        ) from e
     except Exception as e:
         logger.error(f"Error creating review: {str(e)}")
         raise HTTPException(
@@ -72,53 +110,69 @@ async def get_book_reviews(
     session: AsyncSession = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[int] = Query(None, ge=1),
 ):
     """
-    Get all reviews for a book with pagination.
+    Get all reviews for a book with pagination, newest first.
+
+    Pages can be walked by ``skip`` or, cheaper for deep pages, by passing
+    the previous page's ``next_cursor`` as ``cursor``. In cursor mode the
+    total counts the reviews after the cursor and ``page`` and
+    ``total_pages`` are null.
 
     Args:
         book_id: Book ID
         session: Database session
         skip: Number of records to skip
         limit: Number of records to fetch
+        cursor: ID of the last review already seen (optional)
 
     Returns:
         Paginated list of reviews
 
     Raises:
-        HTTPException: If book not found
+        HTTPException: If skip and cursor are combined, or book not found
     """
-    # Check if book exists
-    book = await BookService.get_book_by_id(session, book_id)
-    if not book:
+    if cursor is not None and skip:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either skip or cursor, not both"
+        )
+
+    if not await BookService.exists(session, book_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Book not found"
         )
 
     reviews, total = await ReviewService.get_reviews_by_book(
-        session, book_id, skip=skip, limit=limit
+        session, book_id, skip=skip, limit=limit, cursor=cursor
     )
+    next_cursor = reviews[-1].id if skip + len(reviews) < total else None
 
-    return {
-        "items": reviews,
-        "total": total,
-        "page": skip // limit + 1 if limit > 0 else 1,
-        "page_size": limit,
-        "total_pages": (total + limit - 1) // limit if limit > 0 else 1,
-    }
+    fields = {"next_cursor": next_cursor}
+    if cursor is not None:
+        # Page numbers have no meaning relative to a cursor
+        fields.update(page=None, total_pages=None)
+
+    return json_page(ReviewListResponse, reviews, total, skip, limit, **fields)
 
 
 @router.get("/{book_id}/summary", response_model=ReviewSummaryResponse)
 async def get_review_summary(
     book_id: int,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db),
 ):
     """
     Get aggregated review summary and rating for a book.
 
+    The LLM summary is served from cache. On a miss, a statistics-based
+    summary is returned and generation is scheduled in the background.
+
     Args:
         book_id: Book ID
+        background_tasks: Background task queue for summary generation
         session: Database session
 
     Returns:
@@ -129,7 +183,7 @@ async def get_review_summary(
     """
     try:
         # Check if book exists
-        book = await BookService.get_book_by_id(session, book_id)
+        book = await BookService.get_book_by_id_bare(session, book_id)
         if not book:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -141,33 +195,36 @@ async def get_review_summary(
             session, book_id
         )
 
-        # Get review texts for summarization
-        reviews, _ = await ReviewService.get_reviews_by_book(
-            session, book_id, skip=0, limit=5
-        )
-        review_texts = [review.review_text for review in reviews]
-
-        # Generate summary if reviews exist
-        summary_text = ""
-        if review_texts:
-            try:
-                summary_text = await llm_service.generate_review_summary(
-                    book.title, review_texts, avg_rating
-                )
-            except Exception as e:
-                logger.warning(f"Could not generate LLM summary: {str(e)}")
+        # Serve the cached summary, or schedule one and fall back to stats.
+        # Review texts are only fetched when a summary must be generated.
+        if total_reviews:
+            cache_key = _summary_cache_key(book_id, total_reviews, avg_rating)
+            summary_text = _summary_cache.get(cache_key)
+            if summary_text is None:
                 summary_text = f"Book has {total_reviews} reviews with an average rating of {avg_rating}/5."
+                if cache_key not in _summary_pending:
+                    review_texts = await ReviewService.get_recent_review_texts(
+                        session, book_id, limit=5
+                    )
+                    _summary_pending.add(cache_key)
+                    background_tasks.add_task(
+                        _regenerate_review_summary,
+                        cache_key, book.title, review_texts, avg_rating,
+                    )
         else:
             summary_text = "No reviews available for this book yet."
 
-        return ReviewSummaryResponse(
+        # Every field is produced here with the right type, so skip
+        # validation both on construction and in the response_model pass.
+        summary = ReviewSummaryResponse.model_construct(
             book_id=book_id,
             book_title=book.title,
             total_reviews=total_reviews,
             average_rating=avg_rating,
             summary=summary_text,
-            generated_at=datetime.utcnow(),
+            generated_at=datetime.now(timezone.utc),
         )
+        return Response(content=summary.model_dump_json(), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -178,6 +235,109 @@ async def get_review_summary(
         ) from e
 
 
+def _sse_event(data: dict, event: str = "message") -> bytes:
+    """Encode one server-sent event with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _stream_review_summary(
+    cache_key: str, book_title: str, review_texts: List[str], avg_rating: float
+) -> AsyncIterator[bytes]:
+    """
+    Relay an LLM review summary as server-sent events and cache the result.
+
+    An empty result is not cached, so a later request generates again.
+
+    Args:
+        cache_key: Cache key for the book's current review statistics
+        book_title: Book title
+        review_texts: Review texts to summarize
+        avg_rating: Average rating of the book
+
+    Yields:
+        Encoded ``message`` events for each fragment, then ``end`` or ``error``
+    """
+    fragments = []
+    try:
+        async for fragment in llm_service.stream_review_summary(
+            book_title, review_texts, avg_rating
+        ):
+            fragments.append(fragment)
+            yield _sse_event({"text": fragment})
+    except Exception as e:
+        logger.warning(f"Could not stream LLM summary: {str(e)}")
+        yield _sse_event({"detail": "Error generating review summary"}, event="error")
+        return
+    summary_text = "".join(fragments).strip()
+    if summary_text:
+        _summary_cache[cache_key] = summary_text
+    yield _sse_event({}, event="end")
+
+
+@router.get("/{book_id}/summary/stream")
+async def stream_review_summary(
+    book_id: int,
+    session: AsyncSession = Depends(get_db),
+):
+    """
+    Stream the LLM review summary for a book as server-sent events.
+
+    Each ``message`` event carries a ``text`` fragment as it is generated,
+    followed by a final ``end`` event (or ``error`` if generation fails).
+    A summary that is already cached, or the placeholder for a book with no
+    reviews, is sent as a single fragment. While another request is
+    generating the same summary, the statistics-based placeholder is sent
+    instead of starting a second LLM call.
+
+    Args:
+        book_id: Book ID
+        session: Database session
+
+    Returns:
+        ``text/event-stream`` response
+
+    Raises:
+        HTTPException: If book not found
+    """
+    book = await BookService.get_book_by_id_bare(session, book_id)
+    if not book:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Book not found"
+        )
+
+    avg_rating, total_reviews = await ReviewService.get_book_rating_summary(
+        session, book_id
+    )
+    cache_key = _summary_cache_key(book_id, total_reviews, avg_rating)
+    summary_text = (
+        _summary_cache.get(cache_key) if total_reviews
+        else "No reviews available for this book yet."
+    )
+
+    if summary_text is None and cache_key in _summary_pending:
+        summary_text = f"Book has {total_reviews} reviews with an average rating of {avg_rating}/5."
+
+    background = None
+    if summary_text is not None:
+        events = iter([_sse_event({"text": summary_text}), _sse_event({}, event="end")])
+    else:
+        # Everything the stream needs is read here, before the session is released.
+        review_texts = await ReviewService.get_recent_review_texts(session, book_id, limit=5)
+        events = _stream_review_summary(cache_key, book.title, review_texts, avg_rating)
+        # The key stays pending until the response ends, including when the
+        # client disconnects before the stream starts.
+        _summary_pending.add(cache_key)
+        background = BackgroundTask(_summary_pending.discard, cache_key)
+
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+        background=background,
+    )
+
+
 @router.put("/reviews/{review_id}", response_model=ReviewResponse)
 async def update_review(
     review_id: int,
@@ -5,7 +5,8 @@ This module defines all Pydantic models used for request/response serialization
 and validation in the API endpoints.
 """
 
-from pydantic import BaseModel, Field, EmailStr, validator
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter, field_validator
 from datetime import datetime
 from typing import Optional, List
 
@@ -22,14 +23,19 @@ class UserCreate(UserBase):
     """User creation schema."""
     password: str = Field(..., min_length=8)
 
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def password_strong(cls, v):
-        """Validate password strength."""
-        if not any(char.isupper() for char in v):
+        """Validate password strength in a single pass over the string."""
+        has_upper = has_digit = False
+        for char in v:
+            has_upper = has_upper or char.isupper()
+            has_digit = has_digit or char.isdigit()
+            if has_upper and has_digit:
+                return v
+        if not has_upper:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not any(char.isdigit() for char in v):
-            raise ValueError('Password must contain at least one digit')
-        return v
+        raise ValueError('Password must contain at least one digit')
 
 
 class UserResponse(UserBase):
@@ -191,17 +197,74 @@ class PaginatedResponse(BaseModel):
     total_pages: int
 
 
+def paginate(items: list, total: int, skip: int, limit: int) -> dict:
+    """
+    Build the payload for a paginated response.
+
+    Args:
+        items: Items on the current page
+        total: Total number of matching items
+        skip: Number of records skipped
+        limit: Page size (routes enforce ``limit >= 1``)
+
+    Returns:
+        Dictionary matching PaginatedResponse
+    """
+    return {
+        "items": items,
+        "total": total,
+        "page": skip // limit + 1,
+        "page_size": limit,
+        "total_pages": -(-total // limit),
+    }
+
+
+def json_page(
+    model: type[PaginatedResponse], items: list, total: int, skip: int, limit: int, **fields
+) -> Response:
+    """
+    Build an encoded JSON response for one page of ORM rows.
+
+    The rows are validated once and the JSON is returned directly;
+    returning the dict would make FastAPI dump and re-validate every item.
+
+    Args:
+        model: Paginated response model for the page
+        items: ORM rows on the current page
+        total: Total number of matching items
+        skip: Number of records skipped
+        limit: Page size
+        **fields: Extra or overriding response fields
+
+    Returns:
+        ``application/json`` response
+    """
+    page = model.model_validate(
+        {**paginate(items, total, skip, limit), **fields}, from_attributes=True
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json")
+
+
 class BookListResponse(PaginatedResponse):
     """Paginated response for books."""
     items: List[BookResponse]
 
 
 class ReviewListResponse(PaginatedResponse):
-    """Paginated response for reviews."""
-    items: List[ReviewResponse]
-
+    """
+    Paginated response for reviews.
 
+    In cursor mode ``total`` counts the reviews after the cursor, and
+    ``page`` and ``total_pages`` are null since there is no page offset.
+    """
+    items: List[ReviewResponse]
+    page: Optional[int]
+    total_pages: Optional[int]
+    next_cursor: Optional[int] = None
 
 
 # Update forward references
 BookDetailResponse.model_rebuild()
+
+# Validates a list of ORM books in one call using a core schema built once
+BOOK_LIST_ADAPTER = TypeAdapter(List[BookResponse])
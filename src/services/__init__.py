@@ -1,13 +1,32 @@
-"""Services module initialization."""
-
-from src.services.user_service import UserService
-from src.services.book_service import BookService
-from src.services.review_service import ReviewService
-from src.services.recommendation_service import RecommendationService
-
-__all__ = [
-    "UserService",
-    "BookService",
-    "ReviewService",
-    "RecommendationService",
-]
+"""Services module initialization.
+
+Service classes are loaded on first access (PEP 562), so importing one
+service does not pull in the others and their dependencies (for example
+the LLM client behind RecommendationService).
+"""
+
+import importlib
+
+_SERVICE_MODULES = {
+    "UserService": "user_service",
+    "BookService": "book_service",
+    "ReviewService": "review_service",
+    "RecommendationService": "recommendation_service",
+    "SummaryService": "summary_service",
+}
+
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name: str):
+    """Import a service class from its submodule on first access."""
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    service = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = service
+    return service
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -6,12 +6,16 @@ including retrieval, filtering, and pagination.
 """
 
 import logging
+from datetime import datetime
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func, literal, literal_column
 from sqlalchemy.orm import selectinload
 
-from src.models import Book
+from src.core import fetch_page
+from src.models import (
+    Book, Review, book_search_vector,
+)
 from src.schemas import BookCreate, BookUpdate
 
 logger = logging.getLogger(__name__)
@@ -50,7 +54,7 @@ class BookService:
     @staticmethod
     async def get_book_by_id(session: AsyncSession, book_id: int) -> Optional[Book]:
         """
-        Get book by ID.
+        Get book by ID with its reviews and their authors loaded.
 
         Args:
             session: Database session
@@ -59,10 +63,44 @@ class BookService:
         Returns:
             Book instance or None
         """
-        stmt = select(Book).options(selectinload(Book.reviews)).where(Book.id == book_id)
+        stmt = select(Book).options(
+            selectinload(Book.reviews).joinedload(Review.user, innerjoin=True),
+        ).where(Book.id == book_id)
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_book_by_id_bare(session: AsyncSession, book_id: int) -> Optional[Book]:
+        """
+        Get book by ID without loading its reviews.
+
+        A book already in the session's identity map is returned without
+        a query.
+
+        Args:
+            session: Database session
+            book_id: Book ID
+
+        Returns:
+            Book instance or None
+        """
+        return await session.get(Book, book_id)
+
+    @staticmethod
+    async def exists(session: AsyncSession, book_id: int) -> bool:
+        """
+        Check whether a book exists without loading it.
+
+        Args:
+            session: Database session
+            book_id: Book ID
+
+        Returns:
+            True if the book exists, False otherwise
+        """
+        stmt = select(literal(1)).where(Book.id == book_id)
+        return await session.scalar(stmt) is not None
+
     @staticmethod
     async def get_all_books(
         session: AsyncSession,
@@ -92,17 +130,7 @@ class BookService:
         if author:
             query = query.where(Book.author.ilike(f"%{author}%"))
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await session.execute(count_query)
-        total = count_result.scalar() or 0
-
-        # Get paginated results
-        query = query.offset(skip).limit(limit)
-        result = await session.execute(query)
-        books = result.scalars().all()
-
-        return list(books), total
+        return await fetch_page(session, query, skip, limit)
 
     @staticmethod
     async def update_book(
@@ -119,17 +147,24 @@ class BookService:
         Returns:
             Updated book instance or None
         """
-        book = await BookService.get_book_by_id(session, book_id)
-        if not book:
-            return None
-
         # Update only provided fields
         update_data = book_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(book, key, value)
-
+        if not update_data:
+            return await session.get(Book, book_id)
+
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE, then refresh.
+        # updated_at is set explicitly so an instance already in the session
+        # is synchronized with it too.
+        stmt = (
+            update(Book)
+            .where(Book.id == book_id)
+            .values(**update_data, updated_at=datetime.utcnow())
+            .returning(Book)
+        )
+        book = (await session.execute(stmt)).scalar_one_or_none()
         await session.commit()
-        await session.refresh(book)
+        if book is None:
+            return None
 
         logger.info(f"Book updated: {book.title}")
         return book
@@ -146,7 +181,7 @@ class BookService:
         Returns:
             True if deleted, False if not found
         """
-        book = await BookService.get_book_by_id(session, book_id)
+        book = await session.get(Book, book_id)
         if not book:
             return False
 
@@ -166,6 +201,10 @@ class BookService:
         """
         Search books by title or author.
 
+        On Postgres this is a full-text match against the indexed title and
+        author document, ranked by relevance. Other databases fall back to a
+        case-insensitive substring match.
+
         Args:
             session: Database session
             query: Search query string
@@ -175,18 +214,16 @@ class BookService:
         Returns:
             Tuple of (books list, total count)
         """
-        search_query = select(Book).where(
-            (Book.title.ilike(f"%{query}%")) | (Book.author.ilike(f"%{query}%"))
-        )
-
-        # Get total count
-        count_query = select(func.count()).select_from(search_query.subquery())
-        count_result = await session.execute(count_query)
-        total = count_result.scalar() or 0
-
-        # Get paginated results
-        search_query = search_query.offset(skip).limit(limit)
-        result = await session.execute(search_query)
-        books = result.scalars().all()
-
-        return list(books), total
+        if session.get_bind().dialect.name == "postgresql":
+            ts_query = func.plainto_tsquery(literal_column("'simple'"), query)
+            search_query = (
+                select(Book)
+                .where(book_search_vector.op("@@")(ts_query))
+                .order_by(func.ts_rank(book_search_vector, ts_query).desc(), Book.id)
+            )
+        else:
+            search_query = select(Book).where(
+                (Book.title.ilike(f"%{query}%")) | (Book.author.ilike(f"%{query}%"))
+            )
+
+        return await fetch_page(session, search_query, skip, limit)
@@ -6,6 +6,7 @@ book recommendations based on user preferences and reading history.
 """
 
 import logging
+import re
 from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
@@ -15,6 +16,8 @@ from src.utils.llm import llm_service
 
 logger = logging.getLogger(__name__)
 
+_BOOK_ID_PATTERN = re.compile(r"\bID:\s*(\d+)")
+
 
 class RecommendationService:
     """Service for generating book recommendations."""
@@ -66,19 +69,11 @@ class RecommendationService:
         Returns:
             List of popular books
         """
-        # Subquery to get books with their average rating
-        subquery = select(
-            Review.book_id,
-            func.avg(Review.rating).label("avg_rating"),
-            func.count(Review.id).label("review_count")
-        ).group_by(Review.book_id).subquery()
-
-        query = select(Book).join(
-            subquery, Book.id == subquery.c.book_id
-        ).where(
-            subquery.c.review_count >= min_reviews
+        # Ranked on the stored review statistics, walking ix_books_popular
+        query = select(Book).where(
+            Book.review_count >= min_reviews
         ).order_by(
-            subquery.c.avg_rating.desc()
+            Book.average_rating.desc()
         ).limit(limit)
 
         result = await session.execute(query)
@@ -103,16 +98,11 @@ class RecommendationService:
         Returns:
             List of similar books
         """
-        # Get the reference book
-        from src.services.book_service import BookService
-        book = await BookService.get_book_by_id(session, book_id)
-
-        if not book:
-            return []
-
-        # Get similar books
+        # Match on the reference book's genre in a single query; only the
+        # genre column of the reference row is read, not the row and reviews.
+        reference_genre = select(Book.genre).where(Book.id == book_id).scalar_subquery()
         query = select(Book).where(
-            and_(Book.genre == book.genre, Book.id != book_id)
+            and_(Book.genre == reference_genre, Book.id != book_id)
         ).limit(limit)
 
         result = await session.execute(query)
@@ -137,36 +127,45 @@ class RecommendationService:
         Returns:
             Tuple of (recommended books, LLM reasoning)
         """
+        if not llm_service.enabled:
+            return await RecommendationService.get_popular_books(session, limit), ""
+
         try:
-            # Get all available books
-            stmt = select(Book).limit(100)
+            # Load only the prompt's columns for the candidates; they are
+            # also the pool the recommendations are picked from.
+            stmt = select(
+                Book.id,
+                Book.title,
+                Book.author,
+                Book.genre,
+                func.coalesce(Book.average_rating, 0).label("average_rating"),
+            ).order_by(Book.id).limit(100)
             result = await session.execute(stmt)
-            available_books = result.scalars().all()
-
-            # Convert to dictionary format for LLM
-            books_data = [
-                {
-                    "title": book.title,
-                    "author": book.author,
-                    "genre": book.genre,
-                    "id": book.id,
-                    "average_rating": book.average_rating or 0,
-                }
-                for book in available_books
-            ]
+            books_data = [dict(row._mapping) for row in result]
 
             # Generate recommendations using LLM
             reasoning = await llm_service.generate_recommendations(
                 user_preferences, books_data, limit
             )
 
-            # For demonstration, return top books by rating
-            query = select(Book).order_by(Book.id).limit(limit)
-            result = await session.execute(query)
-            recommended_books = result.scalars().all()
+            # Prefer the books the LLM named (the prompt lists them as
+            # "ID:<id>"), then fill up with candidates in ID order.
+            candidate_ids = dict.fromkeys(book["id"] for book in books_data)
+            chosen_ids = dict.fromkeys(
+                int(book_id) for book_id in _BOOK_ID_PATTERN.findall(reasoning)
+                if int(book_id) in candidate_ids
+            )
+            chosen_ids.update(candidate_ids)
+            chosen_ids = list(chosen_ids)[:limit]
+
+            # Full rows are loaded for the chosen books only
+            stmt = select(Book).where(Book.id.in_(chosen_ids))
+            result = await session.execute(stmt)
+            books_by_id = {book.id: book for book in result.scalars()}
+            recommended_books = [books_by_id[book_id] for book_id in chosen_ids if book_id in books_by_id]
 
             logger.info(f"Generated {len(recommended_books)} recommendations for user")
-            return list(recommended_books), reasoning
+            return recommended_books, reasoning
 
         except Exception as e:
             logger.error(f"Error generating recommendations: {str(e)}")
@@ -190,36 +189,27 @@ class RecommendationService:
         Returns:
             List of recommended books
         """
-        # Get genres the user has reviewed positively
-        query = select(Book.genre).join(
+        # Genres the user has reviewed positively
+        favorite_genres = select(Book.genre).join(
             Review, Review.book_id == Book.id
         ).where(
             and_(Review.user_id == user_id, Review.rating >= 4)
         ).group_by(Book.genre).limit(3)
 
+        # Number books within each favorite genre and order by that rank,
+        # so the page takes books from the genres in turn, in one query.
+        ranked = select(
+            Book.id,
+            func.row_number().over(partition_by=Book.genre, order_by=Book.id).label("rank"),
+        ).where(Book.genre.in_(favorite_genres.scalar_subquery())).subquery()
+
+        query = select(Book).join(ranked, ranked.c.id == Book.id).order_by(ranked.c.rank, Book.id).limit(limit)
+
         result = await session.execute(query)
-        favorite_genres = [row[0] for row in result.all()]
+        recommendations = list(result.scalars().all())
 
-        if not favorite_genres:
+        if not recommendations:
             # If no favorite genres, return popular books
             return await RecommendationService.get_popular_books(session, limit)
 
-        # Get books in favorite genres
-        recommendations = []
-        for genre in favorite_genres:
-            books = await RecommendationService.get_recommendations_by_genre(
-                session, genre, limit // len(favorite_genres) + 1
-            )
-            recommendations.extend(books)
-
-        # Remove duplicates and limit
-        seen_ids = set()
-        unique_recommendations = []
-        for book in recommendations:
-            if book.id not in seen_ids:
-                unique_recommendations.append(book)
-                seen_ids.add(book.id)
-                if len(unique_recommendations) >= limit:
-                    break
-
-        return unique_recommendations
+        return recommendations
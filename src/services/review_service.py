@@ -8,10 +8,12 @@ and deleting book reviews.
 import logging
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, func, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 
-from src.models import Review
+from src.core import fetch_page
+from src.models import Book, Review, rounded_average
 from src.schemas import ReviewCreate, ReviewUpdate
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,37 @@ logger = logging.getLogger(__name__)
 class ReviewService:
     """Service for review management operations."""
 
+    @staticmethod
+    async def refresh_book_ratings(session: AsyncSession, book_ids: List[int]) -> None:
+        """
+        Recompute books' stored rating statistics from their reviews.
+
+        Runs in the caller's transaction, so the statistics commit together
+        with the review change. The books are locked first: under READ
+        COMMITTED a concurrent review writer on the same book then waits,
+        and its recompute starts after this transaction commits and sees
+        this review, so no write is missed.
+
+        Args:
+            session: Database session
+            book_ids: Book IDs
+        """
+        # Lock in ID order so refreshes of overlapping books cannot deadlock
+        lock = select(Book.id).where(Book.id.in_(book_ids)).order_by(Book.id).with_for_update()
+        await session.execute(lock)
+
+        book_reviews = Review.book_id == Book.id
+        stmt = (
+            update(Book)
+            .where(Book.id.in_(book_ids))
+            .values(
+                average_rating=select(rounded_average(Review.rating)).where(book_reviews).scalar_subquery(),
+                review_count=select(func.count(Review.id)).where(book_reviews).scalar_subquery(),
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        await session.execute(stmt)
+
     @staticmethod
     async def create_review(
         session: AsyncSession, book_id: int, user_id: int, review_data: ReviewCreate
@@ -35,6 +68,9 @@ class ReviewService:
 
         Returns:
             Created review instance
+
+        Raises:
+            IntegrityError: If the book or user does not exist
         """
         review = Review(
             book_id=book_id,
@@ -44,10 +80,15 @@ class ReviewService:
         )
 
         session.add(review)
-        await session.commit()
-        await session.commit()
+        try:
+            await session.flush()
+            await ReviewService.refresh_book_ratings(session, [book_id])
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            raise
         # Eagerly load the user relationship for the response
-        stmt = select(Review).options(selectinload(Review.user)).where(Review.id == review.id)
+        stmt = select(Review).options(joinedload(Review.user, innerjoin=True)).where(Review.id == review.id)
         result = await session.execute(stmt)
         review = result.scalar_one()
 
@@ -66,7 +107,7 @@ class ReviewService:
         Returns:
             Review instance or None
         """
-        stmt = select(Review).options(selectinload(Review.user)).where(Review.id == review_id)
+        stmt = select(Review).options(joinedload(Review.user, innerjoin=True)).where(Review.id == review_id)
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -76,30 +117,29 @@ class ReviewService:
         book_id: int,
         skip: int = 0,
         limit: int = 10,
+        cursor: Optional[int] = None,
     ) -> tuple[List[Review], int]:
         """
-        Get all reviews for a book with pagination.
+        Get all reviews for a book with pagination, newest first.
+
+        Passing the last seen review ID as ``cursor`` continues after it via
+        ix_reviews_book_id_id instead of scanning and discarding ``skip`` rows.
 
         Args:
             session: Database session
             book_id: Book ID
             skip: Number of records to skip
             limit: Number of records to fetch
+            cursor: Only return reviews with a lower ID (optional)
 
         Returns:
-            Tuple of (reviews list, total count)
+            Tuple of (reviews list, total count from the cursor on)
         """
-        # Get total count
-        count_stmt = select(func.count(Review.id)).where(Review.book_id == book_id)
-        count_result = await session.execute(count_stmt)
-        total = count_result.scalar() or 0
-
-        # Get paginated results
-        stmt = select(Review).options(selectinload(Review.user)).where(Review.book_id == book_id).offset(skip).limit(limit)
-        result = await session.execute(stmt)
-        reviews = result.scalars().all()
-
-        return list(reviews), total
+        stmt = select(Review).options(joinedload(Review.user, innerjoin=True)).where(Review.book_id == book_id)
+        if cursor is not None:
+            stmt = stmt.where(Review.id < cursor)
+        stmt = stmt.order_by(Review.id.desc())
+        return await fetch_page(session, stmt, skip, limit)
 
     @staticmethod
     async def get_reviews_by_user(
@@ -107,30 +147,26 @@ class ReviewService:
         user_id: int,
         skip: int = 0,
         limit: int = 10,
+        cursor: Optional[int] = None,
     ) -> tuple[List[Review], int]:
         """
-        Get all reviews by a user with pagination.
+        Get all reviews by a user with pagination, newest first.
 
         Args:
             session: Database session
             user_id: User ID
             skip: Number of records to skip
             limit: Number of records to fetch
+            cursor: Only return reviews with a lower ID (optional)
 
         Returns:
-            Tuple of (reviews list, total count)
+            Tuple of (reviews list, total count from the cursor on)
         """
-        # Get total count
-        count_stmt = select(func.count(Review.id)).where(Review.user_id == user_id)
-        count_result = await session.execute(count_stmt)
-        total = count_result.scalar() or 0
-
-        # Get paginated results
-        stmt = select(Review).where(Review.user_id == user_id).offset(skip).limit(limit)
-        result = await session.execute(stmt)
-        reviews = result.scalars().all()
-
-        return list(reviews), total
+        stmt = select(Review).options(joinedload(Review.user, innerjoin=True)).where(Review.user_id == user_id)
+        if cursor is not None:
+            stmt = stmt.where(Review.id < cursor)
+        stmt = stmt.order_by(Review.id.desc())
+        return await fetch_page(session, stmt, skip, limit)
 
     @staticmethod
     async def update_review(
@@ -156,10 +192,12 @@ class ReviewService:
         for key, value in update_data.items():
             setattr(review, key, value)
 
-        await session.commit()
+        if "rating" in update_data:
+            await session.flush()
+            await ReviewService.refresh_book_ratings(session, [review.book_id])
         await session.commit()
         # Eagerly load user for response
-        stmt = select(Review).options(selectinload(Review.user)).where(Review.id == review.id)
+        stmt = select(Review).options(joinedload(Review.user, innerjoin=True)).where(Review.id == review.id)
         result = await session.execute(stmt)
         review = result.scalar_one()
 
@@ -178,16 +216,43 @@ class ReviewService:
         Returns:
             True if deleted, False if not found
         """
-        review = await ReviewService.get_review_by_id(session, review_id)
-        if not review:
+        stmt = delete(Review).where(Review.id == review_id).returning(Review.book_id)
+        book_id = await session.scalar(stmt)
+        if book_id is None:
             return False
 
-        await session.delete(review)
+        await ReviewService.refresh_book_ratings(session, [book_id])
         await session.commit()
 
         logger.info(f"Review deleted: {review_id}")
         return True
 
+    @staticmethod
+    async def get_recent_review_texts(
+        session: AsyncSession, book_id: int, limit: int = 5
+    ) -> List[str]:
+        """
+        Get the texts of a book's most recent reviews.
+
+        Only the text column is selected; no Review or User objects are built.
+
+        Args:
+            session: Database session
+            book_id: Book ID
+            limit: Maximum number of texts
+
+        Returns:
+            List of review texts, newest first
+        """
+        stmt = (
+            select(Review.review_text)
+            .where(Review.book_id == book_id)
+            .order_by(Review.created_at.desc())
+            .limit(limit)
+        )
+        result = await session.scalars(stmt)
+        return list(result)
+
     @staticmethod
     async def get_book_rating_summary(
         session: AsyncSession, book_id: int
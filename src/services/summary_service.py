@@ -0,0 +1,78 @@
+"""
+Summary service for stored LLM book summaries.
+
+This module persists generated summaries keyed by a hash of their input,
+so summarizing the same content again is a single primary-key lookup
+instead of an LLM call, including after a restart.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from src.core.config import settings
+from src.models import BookSummary
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryService:
+    """Service for storing and retrieving generated book summaries."""
+
+    @staticmethod
+    def summary_key(title: str, author: str, content: str, max_tokens: Optional[int] = None) -> str:
+        """
+        Build the storage key for a summary request.
+
+        Args:
+            title: Book title
+            author: Book author
+            content: Book content
+            max_tokens: Max tokens (optional, defaults to the configured limit)
+
+        Returns:
+            Hex SHA-256 of the model, token limit and inputs
+        """
+        max_tokens = max_tokens or settings.max_tokens
+        # Only the prompt's share of the content affects the summary
+        content = content[:settings.max_content_chars]
+        payload = "\x1f".join((settings.llm_model, str(max_tokens), title, author, content))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    async def get_summary(session: AsyncSession, cache_key: str) -> Optional[str]:
+        """
+        Get a stored summary.
+
+        Args:
+            session: Database session
+            cache_key: Key from ``summary_key``
+
+        Returns:
+            Summary text or None
+        """
+        stmt = select(BookSummary.summary).where(BookSummary.cache_key == cache_key)
+        return await session.scalar(stmt)
+
+    @staticmethod
+    async def store_summary(session: AsyncSession, cache_key: str, summary: str) -> None:
+        """
+        Store a generated summary.
+
+        A concurrent request may have stored the same key first; that row
+        is kept.
+
+        Args:
+            session: Database session
+            cache_key: Key from ``summary_key``
+            summary: Generated summary text
+        """
+        session.add(BookSummary(cache_key=cache_key, summary=summary))
+        try:
+            await session.commit()
+        except IntegrityError:
+            await session.rollback()
+            logger.debug(f"Summary {cache_key} already stored")
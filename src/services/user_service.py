@@ -5,14 +5,18 @@ This module contains business logic for user creation, authentication,
 and user profile management.
 """
 
+import asyncio
 import logging
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
+from sqlalchemy.exc import IntegrityError
 
-from src.models import User, UserRole
+from src.core import fetch_page
+from src.models import Review, User, UserRole
 from src.auth import hash_password, verify_password, create_tokens
 from src.schemas import UserCreate, UserResponse
+from src.services.review_service import ReviewService
 
 logger = logging.getLogger(__name__)
 
@@ -35,25 +39,26 @@ class UserService:
         Raises:
             ValueError: If username or email already exists
         """
-        # Check if user already exists
-        stmt = select(User).where(
-            (User.username == user_data.username) | (User.email == user_data.email)
-        )
-        result = await session.execute(stmt)
-        if result.scalar_one_or_none():
-            raise ValueError("User with this username or email already exists")
+        # bcrypt is deliberately slow; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        hashed_password = await loop.run_in_executor(None, hash_password, user_data.password)
 
-        # Create new user
+        # Duplicates are rejected by the unique username and email
+        # constraints, so the common case is a single INSERT.
         user = User(
             username=user_data.username,
             email=user_data.email,
-            hashed_password=hash_password(user_data.password),
+            hashed_password=hashed_password,
             role=UserRole.USER,
-            is_active=1,
+            is_active=True,
         )
 
         session.add(user)
-        await session.commit()
+        try:
+            await session.commit()
+        except IntegrityError as e:
+            await session.rollback()
+            raise ValueError("User with this username or email already exists") from e
         await session.refresh(user)
 
         logger.info(f"User created: {user.username}")
@@ -64,6 +69,9 @@ class UserService:
         """
         Get user by ID.
 
+        A user already in the session's identity map is returned without
+        a query.
+
         Args:
             session: Database session
             user_id: User ID
@@ -71,9 +79,7 @@ class UserService:
         Returns:
             User instance or None
         """
-        stmt = select(User).where(User.id == user_id)
-        result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await session.get(User, user_id)
 
     @staticmethod
     async def get_user_by_username(session: AsyncSession, username: str) -> Optional[User]:
@@ -106,15 +112,21 @@ class UserService:
         Returns:
             Tuple of (user, (access_token, refresh_token)) or (None, None)
         """
-        user = await UserService.get_user_by_username(session, username)
+        stmt = select(User).where(User.username == username, User.is_active.is_(True))
+        result = await session.execute(stmt)
+        user = result.scalar_one_or_none()
 
-        if not user or not user.is_active:
+        if not user:
             return None, None
 
-        if not verify_password(password, user.hashed_password):
+        # bcrypt is deliberately slow; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(
+            None, verify_password, password, user.hashed_password
+        ):
             return None, None
 
-        tokens = create_tokens(user.id, user.username, user.role.value)
+        tokens = create_tokens(user.id, user.username, user.role)
         logger.info(f"User authenticated: {user.username}")
         return user, tokens
 
@@ -133,17 +145,7 @@ class UserService:
         Returns:
             Tuple of (users list, total count)
         """
-        # Get total count
-        count_stmt = select(User)
-        count_result = await session.execute(count_stmt)
-        total = len(count_result.all())
-
-        # Get paginated results
-        stmt = select(User).offset(skip).limit(limit)
-        result = await session.execute(stmt)
-        users = result.scalars().all()
-
-        return list(users), total
+        return await fetch_page(session, select(User), skip, limit)
 
     @staticmethod
     async def delete_user(session: AsyncSession, user_id: int) -> bool:
@@ -157,11 +159,18 @@ class UserService:
         Returns:
             True if deleted, False if not found
         """
-        user = await UserService.get_user_by_id(session, user_id)
-        if not user:
+        # The user's reviews go with the row (ON DELETE CASCADE), so note the
+        # books whose rating statistics need recomputing first.
+        reviewed = select(Review.book_id).where(Review.user_id == user_id).distinct()
+        book_ids = list(await session.scalars(reviewed))
+
+        result = await session.execute(delete(User).where(User.id == user_id))
+        if not result.rowcount:
+            await session.rollback()
             return False
 
-        await session.delete(user)
+        if book_ids:
+            await ReviewService.refresh_book_ratings(session, book_ids)
         await session.commit()
         logger.info(f"User deleted: {user_id}")
         return True
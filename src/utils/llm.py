@@ -1,20 +1,64 @@
 import logging
 import asyncio
-from typing import Optional, List, Dict, Any
-from groq import Groq
-from functools import partial
+import hashlib
+import time
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
+import httpx
+from cachetools import TLRUCache
+from groq import AsyncGroq
 
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Prompt templates, built once at import and filled with str.format
+_SUMMARY_PROMPT = (
+    "Generate a concise summary for the following book content.\n"
+    "The summary should be 2-3 sentences and capture the main ideas.\n"
+    "\n"
+    "Book Title: {title}\n"
+    "Author: {author}\n"
+    "\n"
+    "Content:\n"
+    "{content}\n"
+    "\n"
+    "Summary:"
+)
+
+_REVIEW_SUMMARY_PROMPT = (
+    'Summarize the following reviews for the book "{book_title}".\n'
+    "The book has an average rating of {average_rating}/5.\n"
+    "Provide key insights about what readers liked and disliked.\n"
+    "\n"
+    "Reviews:\n"
+    "{reviews}\n"
+    "\n"
+    "Summary:"
+)
+
+_RECOMMENDATIONS_PROMPT = (
+    "Based on the user preferences below, recommend {limit} books from the available list.\n"
+    "Provide a brief explanation for each recommendation.\n"
+    "\n"
+    "User Preferences:\n"
+    "{user_preferences}\n"
+    "\n"
+    "Available Books:\n"
+    "{books}\n"
+    "\n"
+    "Recommendations:"
+)
+
+# Caps in-flight Groq calls across the process to stay within rate limits
+_llm_sem = asyncio.Semaphore(settings.llm_max_concurrency)
+
 
 class LLMService:
     """
     Service for interacting with LLM models via Groq API.
     
-    Provides async wrappers around the synchronous Groq client to ensure
-    non-blocking operation within the FastAPI event loop.
+    Uses the SDK's async client, so API calls are awaited on the FastAPI
+    event loop and share one HTTP connection pool.
     """
 
     def __init__(self):
@@ -24,12 +68,92 @@ class LLMService:
             logger.warning("Groq API key not configured. LLM features will be disabled.")
             self.client = None
         else:
-            self.client = Groq(api_key=settings.groq_api_key)
+            # One client per process; its pool keeps a warm connection for
+            # every call the concurrency semaphore lets through.
+            self.client = AsyncGroq(
+                api_key=settings.groq_api_key,
+                timeout=settings.llm_timeout,
+                max_retries=settings.llm_max_retries,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=settings.llm_max_concurrency,
+                        max_keepalive_connections=settings.llm_max_concurrency,
+                    ),
+                ),
+            )
+
+        # Completions keyed by (kind, prompt hash); each kind has its own TTL.
+        self._ttls = {
+            "summary": settings.llm_cache_ttl,
+            "review_summary": settings.llm_cache_ttl,
+            "recommendations": settings.llm_recommendation_cache_ttl,
+        }
+        self._cache = TLRUCache(
+            maxsize=settings.llm_cache_size,
+            ttu=lambda key, value, now: now + self._ttls[key[0]],
+            timer=time.monotonic,
+        )
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a Groq client is configured."""
+        return self.client is not None
+
+    async def close(self) -> None:
+        """Close the Groq client's HTTP connections."""
+        if self.client:
+            await self.client.close()
+
+    async def _complete(
+        self, kind: str, prompt: str, max_tokens: int
+    ) -> str:
+        """
+        Run a chat completion, serving repeated prompts from the cache.
+
+        Concurrent misses for the same prompt share one API call: the first
+        caller generates while the others wait on the key's lock and then
+        read the cached result. Failures are not cached.
 
-    async def _run_in_thread(self, func, *args, **kwargs):
-        """Run a blocking function in a separate thread."""
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+        Args:
+            kind: Completion kind, which selects the cache TTL
+            prompt: Prompt text
+            max_tokens: Max tokens for the completion
+
+        Returns:
+            Completion text
+        """
+        digest = hashlib.blake2b(
+            f"{settings.llm_model}|{max_tokens}|{prompt}".encode(), digest_size=16
+        ).hexdigest()
+        key = (kind, digest)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+
+                async with _llm_sem:
+                    chat_completion = await self.client.chat.completions.create(
+                        messages=[
+                            {"role": "user", "content": prompt}
+                        ],
+                        model=settings.llm_model,
+                        max_tokens=max_tokens,
+                        temperature=0.7,
+                    )
+                text = chat_completion.choices[0].message.content.strip()
+                self._cache[key] = text
+                return text
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
 
     async def generate_summary(
         self,
@@ -54,36 +178,56 @@ class LLMService:
             raise RuntimeError("LLM service not configured.")
 
         max_tokens = max_tokens or settings.max_tokens
+        prompt = self._summary_prompt(title, author, content)
+
+        try:
+            return await self._complete("summary", prompt, max_tokens)
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Failed to generate summary: {str(e)}") from e
 
-        prompt = f"""
-        Generate a concise summary for the following book content.
-        The summary should be 2-3 sentences and capture the main ideas.
+    async def stream_summary(
+        self,
+        title: str,
+        author: str,
+        content: str,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a summary for book content chunk by chunk as it is generated.
 
-        Book Title: {title}
-        Author: {author}
+        Args:
+            title: Book title
+            author: Book author
+            content: Book content
+            max_tokens: Max tokens (optional)
 
-        Content:
-        {content}
+        Yields:
+            Text fragments of the summary
 
-        Summary:
+        Raises:
+            RuntimeError: If the service is not configured or the request fails
         """
+        if not self.client:
+            raise RuntimeError("LLM service not configured.")
+
+        max_tokens = max_tokens or settings.max_tokens
+        prompt = self._summary_prompt(title, author, content)
 
         try:
-            # Run blocking API call in thread pool
-            chat_completion = await self._run_in_thread(
-                self.client.chat.completions.create,
-                messages=[
-                    {"role": "user", "content": prompt.strip()}
-                ],
-                model=settings.llm_model,
-                max_tokens=max_tokens,
-                temperature=0.7,
-            )
-            return chat_completion.choices[0].message.content.strip()
+            async for fragment in self._stream(prompt, max_tokens):
+                yield fragment
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}", exc_info=True)
+            logger.error(f"Error streaming summary: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to generate summary: {str(e)}") from e
 
+    @staticmethod
+    def _summary_prompt(title: str, author: str, content: str) -> str:
+        """Build the book summary prompt."""
+        return _SUMMARY_PROMPT.format(
+            title=title, author=author, content=content[:settings.max_content_chars]
+        )
+
     async def generate_review_summary(
         self,
         book_title: str,
@@ -96,35 +240,92 @@ class LLMService:
             raise RuntimeError("LLM service not configured.")
 
         max_tokens = max_tokens or settings.max_tokens
-        
-        # Limit reviews to avoid token limits
-        reviews_text = "\n".join([f"- {r}" for r in reviews[:10]])
+        prompt = self._review_summary_prompt(book_title, reviews, average_rating)
+
+        try:
+            return await self._complete("review_summary", prompt, max_tokens)
+        except Exception as e:
+            logger.error(f"Error generating review summary: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Failed to generate review summary: {str(e)}") from e
+
+    async def stream_review_summary(
+        self,
+        book_title: str,
+        reviews: list,
+        average_rating: float,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a review summary chunk by chunk as the model produces it.
 
-        prompt = f"""
-        Summarize the following reviews for the book "{book_title}".
-        The book has an average rating of {average_rating}/5.
-        Provide key insights about what readers liked and disliked.
+        Args:
+            book_title: Book title
+            reviews: Review texts to summarize
+            average_rating: Average rating of the book
+            max_tokens: Max tokens (optional)
 
-        Reviews:
-        {reviews_text}
+        Yields:
+            Text fragments of the summary
 
-        Summary:
+        Raises:
+            RuntimeError: If the service is not configured or the request fails
         """
+        if not self.client:
+            raise RuntimeError("LLM service not configured.")
+
+        max_tokens = max_tokens or settings.max_tokens
+        prompt = self._review_summary_prompt(book_title, reviews, average_rating)
 
         try:
-            chat_completion = await self._run_in_thread(
-                self.client.chat.completions.create,
+            async for fragment in self._stream(prompt, max_tokens):
+                yield fragment
+        except Exception as e:
+            logger.error(f"Error streaming review summary: {str(e)}", exc_info=True)
+            raise RuntimeError(f"Failed to generate review summary: {str(e)}") from e
+
+    async def _stream(self, prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """
+        Stream a chat completion's text fragments, uncached.
+
+        The concurrency slot is held until the stream is closed, since an
+        open stream is an in-flight Groq request.
+
+        Args:
+            prompt: Prompt text
+            max_tokens: Max tokens for the completion
+
+        Yields:
+            Non-empty text fragments
+        """
+        async with _llm_sem:
+            stream = await self.client.chat.completions.create(
                 messages=[
-                    {"role": "user", "content": prompt.strip()}
+                    {"role": "user", "content": prompt}
                 ],
                 model=settings.llm_model,
                 max_tokens=max_tokens,
                 temperature=0.7,
+                stream=True,
             )
-            return chat_completion.choices[0].message.content.strip()
-        except Exception as e:
-            logger.error(f"Error generating review summary: {str(e)}", exc_info=True)
-            raise RuntimeError(f"Failed to generate review summary: {str(e)}") from e
+
+            try:
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                await stream.response.aclose()
+
+    @staticmethod
+    def _review_summary_prompt(
+        book_title: str, reviews: list, average_rating: float
+    ) -> str:
+        """Build the review summary prompt."""
+        # Limit reviews to avoid token limits
+        reviews_text = "\n".join([f"- {r}" for r in reviews[:10]])
+
+        return _REVIEW_SUMMARY_PROMPT.format(
+            book_title=book_title, average_rating=average_rating, reviews=reviews_text
+        )
 
     async def generate_recommendations(
         self,
@@ -145,30 +346,12 @@ class LLMService:
             for b in available_books[:30]  # Limit context
         ])
 
-        prompt = f"""
-        Based on the user preferences below, recommend {limit} books from the available list.
-        Provide a brief explanation for each recommendation.
-
-        User Preferences:
-        {user_preferences}
-
-        Available Books:
-        {books_text}
-
-        Recommendations:
-        """
+        prompt = _RECOMMENDATIONS_PROMPT.format(
+            limit=limit, user_preferences=user_preferences, books=books_text
+        )
 
         try:
-            chat_completion = await self._run_in_thread(
-                self.client.chat.completions.create,
-                messages=[
-                    {"role": "user", "content": prompt.strip()}
-                ],
-                model=settings.llm_model,
-                max_tokens=max_tokens,
-                temperature=0.7,
-            )
-            return chat_completion.choices[0].message.content.strip()
+            return await self._complete("recommendations", prompt, max_tokens)
         except Exception as e:
             logger.error(f"Error generating recommendations: {str(e)}", exc_info=True)
             raise RuntimeError(f"Failed to generate recommendations: {str(e)}") from e
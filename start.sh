@@ -0,0 +1,10 @@
+#!/bin/sh
+# Start the API under gunicorn with one Uvicorn worker process per core.
+# Override the worker count with WEB_CONCURRENCY.
+set -e
+
+exec gunicorn src.main:app \
+    -k uvicorn.workers.UvicornWorker \
+    -w "${WEB_CONCURRENCY:-$(nproc)}" \
+    --worker-connections 1000 \
+    -b "0.0.0.0:${PORT:-8000}"
@@ -5,82 +5,217 @@ This module provides pytest fixtures and configuration
 for running tests.
 """
 
+import os
+import sys
+
+# bcrypt's minimum cost keeps password hashing cheap in tests. Set before
+# the app is imported, since settings are read at import.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
 import asyncio
+from types import SimpleNamespace
+from sqlalchemy import event, insert
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from httpx import AsyncClient
-from unittest.mock import patch, AsyncMock
+from sqlalchemy.pool import StaticPool
+from httpx import ASGITransport, AsyncClient
+from collections import Counter
+from unittest.mock import patch
 
 from src.main import app
+from src.auth import hash_password
+from src.models import Book
+from src.schemas import BookCreate
 from src.core.database import Base, get_db
 from src.core.config import settings
+from src.services import BookService
+from src.routes import review_routes
 
 
-# Database URL for testing
+# Database URL for testing. Each pytest-xdist worker is a separate process
+# with its own in-memory database.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# Password of the shared test user created by ``auth_user``
+TEST_PASSWORD = "TestPassword123"
+
+
+class _LLMStub:
+    """LLM service stand-in returning constant completions and counting calls."""
+
+    enabled = True
+
+    def __init__(self):
+        self.calls = Counter()
+
+    async def generate_summary(self, *args, **kwargs) -> str:
+        self.calls["generate_summary"] += 1
+        return "Generated summary"
+
+    async def generate_review_summary(self, *args, **kwargs) -> str:
+        self.calls["generate_review_summary"] += 1
+        return "Generated review summary"
+
+    async def generate_recommendations(self, *args, **kwargs) -> str:
+        self.calls["generate_recommendations"] += 1
+        return "Generated recommendations"
+
 
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an event loop for the entire test session."""
+    """Create an event loop for the entire test session, on uvloop like the app."""
+    if sys.platform == "win32":
+        # uvloop is unavailable; the proactor loop is unsupported by asyncpg
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    else:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Each test gets a fresh database, so cached entries must not leak across tests."""
+    review_routes._summary_cache.clear()
+    review_routes._summary_pending.clear()
+    yield
+    review_routes._summary_cache.clear()
+    review_routes._summary_pending.clear()
+
+
+@pytest.fixture(scope="session")
 async def test_db():
-    """Create a test database and tables."""
+    """Create the test database engine and tables once per run."""
+    # An in-memory database lives only as long as its connection, so the
+    # whole run shares a single one.
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         future=True,
+        # Same compiled-statement cache as the app engine
+        query_cache_size=1200,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
+    # Enforce foreign keys like the app engine does. pysqlite's implicit
+    # transaction handling breaks SAVEPOINT, so BEGIN is emitted explicitly.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create session factory
-    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield engine
 
-    yield async_session
+    await engine.dispose()
 
-    # Cleanup
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
+@pytest.fixture
+async def test_sessionmaker(test_db):
+    """
+    Session factory whose work is rolled back after the test.
+
+    Every session shares one connection inside an outer transaction; session
+    commits only release SAVEPOINTs, so each test starts from empty tables.
+    """
+    async with test_db.connect() as connection:
+        transaction = await connection.begin()
+        yield async_sessionmaker(
+            connection,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await transaction.rollback()
 
 
 @pytest.fixture
-async def db_session(test_db):
+async def db_session(test_sessionmaker):
     """Get a database session for testing."""
-    async with test_db() as session:
+    async with test_sessionmaker() as session:
         yield session
-        await session.close()
+
+
+@pytest.fixture(scope="session")
+async def http_client():
+    """
+    One ASGI client for the whole run; tests swap the database override.
+
+    Requests are served in-process, so client timeouts only add overhead.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test", timeout=None
+    ) as client:
+        yield client
 
 
 @pytest.fixture
-def test_client(test_db):
+def test_client(http_client, test_sessionmaker):
     """Create a test client for API testing with test database."""
     async def override_get_db():
-        async with test_db() as session:
+        async with test_sessionmaker() as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    yield http_client
+    app.dependency_overrides.clear()
 
-    client = AsyncClient(app=app, base_url="http://test")
-    yield client
 
-    app.dependency_overrides.clear()
+@pytest.fixture
+async def test_book(db_session):
+    """Create a test book."""
+    book_data = BookCreate(
+        title="Test Book",
+        author="Test Author",
+        genre="Fiction",
+    )
+    return await BookService.create_book(db_session, book_data)
+
+
+@pytest.fixture
+def bulk_create_books(db_session):
+    """
+    Return a helper that inserts books with one INSERT ... RETURNING.
+
+    The helper takes a list of ``Book`` column dicts and returns lightweight
+    records of those columns plus ``id``, in the same order. No ORM objects
+    are built or refreshed, since fixtures only read IDs and given fields.
+    """
+    async def create(specs: list[dict]) -> list[SimpleNamespace]:
+        result = await db_session.execute(
+            insert(Book).returning(Book.id, sort_by_parameter_order=True),
+            specs,
+        )
+        await db_session.commit()
+        return [
+            SimpleNamespace(id=book_id, **spec)
+            for book_id, spec in zip(result.scalars(), specs)
+        ]
+
+    return create
+
+
+@pytest.fixture(scope="session")
+def test_password_hash():
+    """bcrypt hash of TEST_PASSWORD, computed once per run."""
+    return hash_password(TEST_PASSWORD)
 
 
 @pytest.fixture
 def mock_llm_service():
-    """Mock LLM service for testing."""
-    with patch('src.utils.llm.llm_service') as mock:
-        mock.generate_summary = AsyncMock(return_value="Generated summary")
-        mock.generate_review_summary = AsyncMock(return_value="Generated review summary")
-        mock.generate_recommendations = AsyncMock(return_value="Generated recommendations")
-        yield mock
+    """Stub LLM service for testing."""
+    stub = _LLMStub()
+    with patch('src.utils.llm.llm_service', stub):
+        yield stub
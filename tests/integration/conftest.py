@@ -0,0 +1,37 @@
+"""
+Integration test fixtures.
+
+This module provides the authenticated user shared by the
+endpoint tests.
+"""
+
+import pytest
+
+from src.auth import create_tokens
+from src.models import User, UserRole
+
+
+@pytest.fixture
+async def auth_user(db_session, test_password_hash):
+    """
+    Create the shared test user.
+
+    The row reuses the session's password hash, so no bcrypt work happens
+    per test. The user can still log in with TEST_PASSWORD.
+    """
+    user = User(
+        username="testuser",
+        email="test@example.com",
+        hashed_password=test_password_hash,
+        role=UserRole.USER,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+def auth_token(auth_user):
+    """Access token for the shared test user, issued without a login request."""
+    access_token, _ = create_tokens(auth_user.id, auth_user.username, auth_user.role)
+    return access_token
@@ -5,13 +5,11 @@ This module tests the full authentication flow including
 registration, login, and profile access.
 """
 
-import pytest
 from httpx import AsyncClient
 from src.services import UserService
 from src.schemas import UserCreate
 
 
-@pytest.mark.asyncio
 async def test_register_user(test_client: AsyncClient):
     """Test user registration."""
     response = await test_client.post(
@@ -30,7 +28,6 @@ async def test_register_user(test_client: AsyncClient):
     assert "id" in data
 
 
-@pytest.mark.asyncio
 async def test_register_duplicate_user(test_client: AsyncClient, db_session):
     """Test registering a duplicate user fails."""
     # Create first user
@@ -54,7 +51,6 @@ async def test_register_duplicate_user(test_client: AsyncClient, db_session):
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
 async def test_login_success(test_client: AsyncClient, db_session):
     """Test successful login."""
     # Create user
@@ -81,7 +77,6 @@ async def test_login_success(test_client: AsyncClient, db_session):
     assert data["token_type"] == "bearer"
 
 
-@pytest.mark.asyncio
 async def test_login_wrong_password(test_client: AsyncClient, db_session):
     """Test login with wrong password fails."""
     # Create user
@@ -104,7 +99,6 @@ async def test_login_wrong_password(test_client: AsyncClient, db_session):
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_login_nonexistent_user(test_client: AsyncClient):
     """Test login with non-existent user fails."""
     response = await test_client.post(
@@ -118,7 +112,6 @@ async def test_login_nonexistent_user(test_client: AsyncClient):
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_get_current_user(test_client: AsyncClient, db_session):
     """Test getting current user profile."""
     # Create user
@@ -151,14 +144,12 @@ async def test_get_current_user(test_client: AsyncClient, db_session):
     assert data["email"] == "test@example.com"
 
 
-@pytest.mark.asyncio
 async def test_get_current_user_without_auth(test_client: AsyncClient):
     """Test accessing protected endpoint without authentication fails."""
     response = await test_client.get("/auth/me")
-    assert response.status_code == 403  # or 401 depending on implementation
+    assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_get_current_user_with_invalid_token(test_client: AsyncClient):
     """Test accessing protected endpoint with invalid token fails."""
     response = await test_client.get(
@@ -166,3 +157,12 @@ async def test_get_current_user_with_invalid_token(test_client: AsyncClient):
         headers={"Authorization": "Bearer invalid_token"}
     )
     assert response.status_code == 401
+
+
+async def test_get_current_user_with_wrong_scheme(test_client: AsyncClient):
+    """Test that a non-Bearer Authorization header is rejected."""
+    response = await test_client.get(
+        "/auth/me",
+        headers={"Authorization": "Basic dXNlcjpwYXNz"}
+    )
+    assert response.status_code == 401
@@ -5,34 +5,11 @@ This module tests the full book CRUD operations
 through the API.
 """
 
-import pytest
 from httpx import AsyncClient
-from src.services import UserService
-from src.schemas import UserCreate, BookCreate
+from src.schemas import BookCreate
 from src.services import BookService
 
 
-@pytest.fixture
-async def auth_token(test_client: AsyncClient, db_session):
-    """Create a user and return auth token."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-    await UserService.create_user(db_session, user_data)
-
-    response = await test_client.post(
-        "/auth/login",
-        json={
-            "username": "testuser",
-            "password": "TestPassword123",
-        }
-    )
-    return response.json()["access_token"]
-
-
-@pytest.mark.asyncio
 async def test_create_book(test_client: AsyncClient, auth_token: str):
     """Test creating a book."""
     response = await test_client.post(
@@ -54,7 +31,6 @@ async def test_create_book(test_client: AsyncClient, auth_token: str):
     assert "id" in data
 
 
-@pytest.mark.asyncio
 async def test_create_book_without_auth(test_client: AsyncClient):
     """Test creating book without authentication fails."""
     response = await test_client.post(
@@ -66,20 +42,16 @@ async def test_create_book_without_auth(test_client: AsyncClient):
         }
     )
 
-    assert response.status_code == 403  # or 401
+    assert response.status_code == 401
 
 
-@pytest.mark.asyncio
-async def test_get_all_books(test_client: AsyncClient, db_session):
+async def test_get_all_books(test_client: AsyncClient, bulk_create_books):
     """Test getting all books."""
     # Create books
-    for i in range(3):
-        book_data = BookCreate(
-            title=f"Book {i}",
-            author=f"Author {i}",
-            genre="Fiction",
-        )
-        await BookService.create_book(db_session, book_data)
+    await bulk_create_books([
+        {"title": f"Book {i}", "author": f"Author {i}", "genre": "Fiction"}
+        for i in range(3)
+    ])
 
     response = await test_client.get("/books")
 
@@ -89,17 +61,13 @@ async def test_get_all_books(test_client: AsyncClient, db_session):
     assert data["total"] == 3
 
 
-@pytest.mark.asyncio
-async def test_get_books_with_pagination(test_client: AsyncClient, db_session):
+async def test_get_books_with_pagination(test_client: AsyncClient, bulk_create_books):
     """Test getting books with pagination."""
     # Create books
-    for i in range(15):
-        book_data = BookCreate(
-            title=f"Book {i}",
-            author=f"Author {i}",
-            genre="Fiction",
-        )
-        await BookService.create_book(db_session, book_data)
+    await bulk_create_books([
+        {"title": f"Book {i}", "author": f"Author {i}", "genre": "Fiction"}
+        for i in range(15)
+    ])
 
     response = await test_client.get("/books?skip=0&limit=10")
 
@@ -110,17 +78,13 @@ async def test_get_books_with_pagination(test_client: AsyncClient, db_session):
     assert data["total_pages"] == 2
 
 
-@pytest.mark.asyncio
-async def test_get_books_with_genre_filter(test_client: AsyncClient, db_session):
+async def test_get_books_with_genre_filter(test_client: AsyncClient, bulk_create_books):
     """Test getting books with genre filter."""
     # Create books with different genres
-    for genre in ["Fiction", "Mystery", "Fiction", "Sci-Fi"]:
-        book_data = BookCreate(
-            title=f"Book in {genre}",
-            author="Author",
-            genre=genre,
-        )
-        await BookService.create_book(db_session, book_data)
+    await bulk_create_books([
+        {"title": f"Book in {genre}", "author": "Author", "genre": genre}
+        for genre in ["Fiction", "Mystery", "Fiction", "Sci-Fi"]
+    ])
 
     response = await test_client.get("/books?genre=Fiction")
 
@@ -130,7 +94,6 @@ async def test_get_books_with_genre_filter(test_client: AsyncClient, db_session)
     assert all(book["genre"] == "Fiction" for book in data["items"])
 
 
-@pytest.mark.asyncio
 async def test_get_book_by_id(test_client: AsyncClient, db_session):
     """Test getting a specific book."""
     book_data = BookCreate(
@@ -148,14 +111,12 @@ async def test_get_book_by_id(test_client: AsyncClient, db_session):
     assert data["author"] == "F. Scott Fitzgerald"
 
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_book(test_client: AsyncClient):
     """Test getting non-existent book fails."""
     response = await test_client.get("/books/999")
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_update_book(test_client: AsyncClient, db_session, auth_token: str):
     """Test updating a book."""
     # Create book
@@ -183,7 +144,6 @@ async def test_update_book(test_client: AsyncClient, db_session, auth_token: str
     assert data["genre"] == "Fiction"  # Unchanged
 
 
-@pytest.mark.asyncio
 async def test_delete_book(test_client: AsyncClient, db_session, auth_token: str):
     """Test deleting a book."""
     # Create book
@@ -203,12 +163,10 @@ async def test_delete_book(test_client: AsyncClient, db_session, auth_token: str
     assert response.status_code == 204
 
     # Verify deletion
-    verify_response = await test_client.get(f"/books/{book.id}")
-    assert verify_response.status_code == 404
+    assert not await BookService.exists(db_session, book.id)
 
 
-@pytest.mark.asyncio
-async def test_search_books(test_client: AsyncClient, db_session):
+async def test_search_books(test_client: AsyncClient, bulk_create_books):
     """Test searching books."""
     # Create books
     books_to_create = [
@@ -217,13 +175,10 @@ async def test_search_books(test_client: AsyncClient, db_session):
         ("1984", "George Orwell"),
     ]
 
-    for title, author in books_to_create:
-        book_data = BookCreate(
-            title=title,
-            author=author,
-            genre="Fiction",
-        )
-        await BookService.create_book(db_session, book_data)
+    await bulk_create_books([
+        {"title": title, "author": author, "genre": "Fiction"}
+        for title, author in books_to_create
+    ])
 
     # Search by title
     response = await test_client.get("/books/search/Gatsby")
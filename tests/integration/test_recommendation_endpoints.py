@@ -5,48 +5,22 @@ This module tests the recommendation and AI summary
 endpoints through the API.
 """
 
+import orjson
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch, AsyncMock
-from src.services import UserService, BookService
-from src.schemas import UserCreate, BookCreate
+from unittest.mock import patch
+from src.routes import recommendation_routes
 
 
 @pytest.fixture
-async def auth_token(test_client: AsyncClient, db_session):
-    """Create a user and return auth token."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-    await UserService.create_user(db_session, user_data)
-
-    response = await test_client.post(
-        "/auth/login",
-        json={
-            "username": "testuser",
-            "password": "TestPassword123",
-        }
-    )
-    return response.json()["access_token"]
-
-
-@pytest.fixture
-async def test_books(db_session):
+async def test_books(bulk_create_books):
     """Create test books."""
-    books = []
-    for genre in ["Fiction", "Fiction", "Mystery", "Sci-Fi"]:
-        book_data = BookCreate(
-            title=f"Book in {genre}",
-            author="Test Author",
-            genre=genre,
-        )
-        books.append(await BookService.create_book(db_session, book_data))
-    return books
+    return await bulk_create_books([
+        {"title": f"Book in {genre}", "author": "Test Author", "genre": genre}
+        for genre in ["Fiction", "Fiction", "Mystery", "Sci-Fi"]
+    ])
 
 
-@pytest.mark.asyncio
 async def test_generate_summary(test_client: AsyncClient, auth_token: str, mock_llm_service):
     """Test generating a book summary."""
     with patch('src.routes.recommendation_routes.llm_service', mock_llm_service):
@@ -67,7 +41,55 @@ async def test_generate_summary(test_client: AsyncClient, auth_token: str, mock_
     assert "generated_at" in data
 
 
-@pytest.mark.asyncio
+async def test_generate_summary_is_stored(test_client: AsyncClient, auth_token: str, mock_llm_service):
+    """Test that repeating a summary request is served without the LLM."""
+    # Serialized once and sent as-is on every request
+    payload = orjson.dumps({
+        "title": "The Great Gatsby",
+        "author": "F. Scott Fitzgerald",
+        "content": "A long content about the great gatsby...",
+    })
+    headers = {
+        "Authorization": f"Bearer {auth_token}",
+        "Content-Type": "application/json",
+    }
+    with patch('src.routes.recommendation_routes.llm_service', mock_llm_service):
+        for _ in range(2):
+            response = await test_client.post(
+                "/ai/generate-summary",
+                content=payload,
+                headers=headers,
+            )
+            assert response.status_code == 200
+            assert response.json()["summary"] == "Generated summary"
+
+    assert mock_llm_service.calls["generate_summary"] == 1
+
+
+async def test_stream_summary(test_client: AsyncClient, auth_token: str, monkeypatch):
+    """Test streaming a summary as plain text."""
+    async def stream(title, author, content, max_tokens):
+        for fragment in ("A tale ", "of excess."):
+            yield fragment
+
+    monkeypatch.setattr(recommendation_routes.llm_service, "client", object())
+    monkeypatch.setattr(recommendation_routes.llm_service, "stream_summary", stream)
+
+    response = await test_client.post(
+        "/ai/generate-summary/stream",
+        json={
+            "title": "The Great Gatsby",
+            "author": "F. Scott Fitzgerald",
+            "content": "A long content about the great gatsby...",
+        },
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.text == "A tale of excess."
+
+
 async def test_get_recommendations(test_client: AsyncClient, test_books, auth_token: str):
     """Test getting recommendations."""
     response = await test_client.post(
@@ -88,7 +110,6 @@ async def test_get_recommendations(test_client: AsyncClient, test_books, auth_to
     assert "generated_at" in data
 
 
-@pytest.mark.asyncio
 async def test_get_recommendations_by_genre(test_client: AsyncClient, test_books, auth_token: str):
     """Test getting recommendations by genre."""
     response = await test_client.get(
@@ -103,7 +124,6 @@ async def test_get_recommendations_by_genre(test_client: AsyncClient, test_books
     assert len(data["recommendations"]) == 2  # 2 Fiction books
 
 
-@pytest.mark.asyncio
 async def test_get_popular_books(test_client: AsyncClient, test_books, auth_token: str):
     """Test getting popular books."""
     response = await test_client.get(
@@ -118,7 +138,6 @@ async def test_get_popular_books(test_client: AsyncClient, test_books, auth_toke
     assert "popular" in data["criteria"].lower()
 
 
-@pytest.mark.asyncio
 async def test_get_similar_books(test_client: AsyncClient, test_books, auth_token: str):
     """Test getting similar books."""
     fiction_book = test_books[0]
@@ -136,7 +155,6 @@ async def test_get_similar_books(test_client: AsyncClient, test_books, auth_toke
     assert len(data["recommendations"]) <= 5
 
 
-@pytest.mark.asyncio
 async def test_get_similar_books_nonexistent(test_client: AsyncClient, auth_token: str):
     """Test getting similar books for non-existent book fails."""
     response = await test_client.get(
@@ -147,7 +165,6 @@ async def test_get_similar_books_nonexistent(test_client: AsyncClient, auth_toke
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_endpoints_require_auth(test_client: AsyncClient):
     """Test that AI endpoints require authentication."""
     endpoints = [
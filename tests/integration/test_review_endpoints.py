@@ -6,43 +6,31 @@ through the API.
 """
 
 import pytest
+from unittest.mock import AsyncMock
 from httpx import AsyncClient
-from src.services import UserService, BookService
-from src.schemas import UserCreate, BookCreate
+from src.routes import review_routes
+from src.auth import create_tokens
+from src.models import Review, UserRole
 
 
 @pytest.fixture
-async def auth_token(test_client: AsyncClient, db_session):
-    """Create a user and return auth token."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-    await UserService.create_user(db_session, user_data)
-
-    response = await test_client.post(
-        "/auth/login",
-        json={
-            "username": "testuser",
-            "password": "TestPassword123",
-        }
-    )
-    return response.json()["access_token"]
+def create_reviews(db_session, test_book, auth_user):
+    """Return a helper that inserts reviews of the test book in one commit."""
+    async def create(count: int) -> None:
+        db_session.add_all(
+            Review(
+                book_id=test_book.id,
+                user_id=auth_user.id,
+                review_text=f"Review {i}",
+                rating=3.0 + i,
+            )
+            for i in range(count)
+        )
+        await db_session.commit()
 
+    return create
 
-@pytest.fixture
-async def test_book(db_session):
-    """Create a test book."""
-    book_data = BookCreate(
-        title="Test Book",
-        author="Test Author",
-        genre="Fiction",
-    )
-    return await BookService.create_book(db_session, book_data)
 
-
-@pytest.mark.asyncio
 async def test_create_review(test_client: AsyncClient, test_book, auth_token: str):
     """Test creating a review."""
     response = await test_client.post(
@@ -60,7 +48,6 @@ async def test_create_review(test_client: AsyncClient, test_book, auth_token: st
     assert data["rating"] == 4.5
 
 
-@pytest.mark.asyncio
 async def test_create_review_for_nonexistent_book(test_client: AsyncClient, auth_token: str):
     """Test creating a review for non-existent book fails."""
     response = await test_client.post(
@@ -73,21 +60,29 @@ async def test_create_review_for_nonexistent_book(test_client: AsyncClient, auth
     )
 
     assert response.status_code == 404
+    assert response.json()["detail"] == "Book not found"
+
 
+async def test_create_review_for_deleted_user(test_client: AsyncClient, test_book):
+    """Test a valid token for a user that no longer exists is reported as such."""
+    access_token, _ = create_tokens(999, "ghost", UserRole.USER)
+
+    response = await test_client.post(
+        f"/books/{test_book.id}/reviews",
+        json={
+            "review_text": "Great book!",
+            "rating": 4.5,
+        },
+        headers={"Authorization": f"Bearer {access_token}"}
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "User not found"
 
-@pytest.mark.asyncio
-async def test_get_book_reviews(test_client: AsyncClient, db_session, test_book, auth_token: str):
+
+async def test_get_book_reviews(test_client: AsyncClient, test_book, create_reviews):
     """Test getting reviews for a book."""
-    # Create multiple reviews
-    for i in range(3):
-        await test_client.post(
-            f"/books/{test_book.id}/reviews",
-            json={
-                "review_text": f"Review {i}",
-                "rating": 3.0 + i,
-            },
-            headers={"Authorization": f"Bearer {auth_token}"}
-        )
+    await create_reviews(3)
 
     response = await test_client.get(f"/books/{test_book.id}/reviews")
 
@@ -97,7 +92,36 @@ async def test_get_book_reviews(test_client: AsyncClient, db_session, test_book,
     assert data["total"] == 3
 
 
-@pytest.mark.asyncio
+async def test_get_book_reviews_by_cursor(test_client: AsyncClient, test_book, create_reviews):
+    """Test walking a book's reviews newest first with next_cursor."""
+    await create_reviews(3)
+
+    texts = []
+    params = {"limit": 2}
+    while True:
+        response = await test_client.get(f"/books/{test_book.id}/reviews", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        if "cursor" in params:
+            assert data["page"] is None
+            assert data["total_pages"] is None
+        texts.extend(item["review_text"] for item in data["items"])
+        if data["next_cursor"] is None:
+            break
+        params["cursor"] = data["next_cursor"]
+
+    assert texts == ["Review 2", "Review 1", "Review 0"]
+
+
+async def test_get_book_reviews_skip_with_cursor(test_client: AsyncClient, test_book):
+    """Test combining skip and cursor is rejected."""
+    response = await test_client.get(
+        f"/books/{test_book.id}/reviews", params={"skip": 2, "cursor": 10}
+    )
+
+    assert response.status_code == 400
+
+
 async def test_get_book_summary(test_client: AsyncClient, test_book, auth_token: str):
     """Test getting book review summary."""
     # Create a review first
@@ -120,7 +144,27 @@ async def test_get_book_summary(test_client: AsyncClient, test_book, auth_token:
     assert data["average_rating"] == 5.0
 
 
-@pytest.mark.asyncio
+async def test_get_book_summary_generated_in_background(
+    test_client: AsyncClient, test_book, auth_token: str, monkeypatch
+):
+    """Test that the LLM summary is generated after the first request and then cached."""
+    generate = AsyncMock(return_value="Readers loved it.")
+    monkeypatch.setattr(review_routes.llm_service, "generate_review_summary", generate)
+
+    await test_client.post(
+        f"/books/{test_book.id}/reviews",
+        json={"review_text": "Great book!", "rating": 5.0},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    first = await test_client.get(f"/books/{test_book.id}/summary")
+    assert first.json()["summary"] != "Readers loved it."
+
+    second = await test_client.get(f"/books/{test_book.id}/summary")
+    assert second.json()["summary"] == "Readers loved it."
+    generate.assert_awaited_once()
+
+
 async def test_get_summary_no_reviews(test_client: AsyncClient, test_book):
     """Test getting summary for book with no reviews."""
     response = await test_client.get(f"/books/{test_book.id}/summary")
@@ -131,7 +175,81 @@ async def test_get_summary_no_reviews(test_client: AsyncClient, test_book):
     assert data["average_rating"] == 0.0
 
 
-@pytest.mark.asyncio
+async def test_stream_book_summary(
+    test_client: AsyncClient, test_book, auth_token: str, monkeypatch
+):
+    """Test streaming the LLM summary as server-sent events and caching it."""
+    async def stream(book_title, reviews, average_rating):
+        for fragment in ("Readers ", "loved it."):
+            yield fragment
+
+    monkeypatch.setattr(review_routes.llm_service, "stream_review_summary", stream)
+
+    await test_client.post(
+        f"/books/{test_book.id}/reviews",
+        json={"review_text": "Great book!", "rating": 5.0},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    response = await test_client.get(f"/books/{test_book.id}/summary/stream")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'event: message\ndata: {"text":"Readers "}\n\n'
+        'event: message\ndata: {"text":"loved it."}\n\n'
+        "event: end\ndata: {}\n\n"
+    )
+
+    summary = await test_client.get(f"/books/{test_book.id}/summary")
+    assert summary.json()["summary"] == "Readers loved it."
+
+
+async def test_stream_book_summary_while_pending(
+    test_client: AsyncClient, test_book, create_reviews, monkeypatch
+):
+    """Test a summary already being generated is not streamed a second time."""
+    stream = AsyncMock()
+    monkeypatch.setattr(review_routes.llm_service, "stream_review_summary", stream)
+    await create_reviews(1)
+    review_routes._summary_pending.add(review_routes._summary_cache_key(test_book.id, 1, 3.0))
+
+    response = await test_client.get(f"/books/{test_book.id}/summary/stream")
+
+    assert response.status_code == 200
+    assert response.text == (
+        'event: message\ndata: {"text":"Book has 1 reviews with an average rating of 3.0/5."}\n\n'
+        "event: end\ndata: {}\n\n"
+    )
+    stream.assert_not_called()
+
+
+async def test_stream_empty_book_summary_not_cached(
+    test_client: AsyncClient, test_book, create_reviews, monkeypatch
+):
+    """Test an empty streamed summary is not cached and the key is released."""
+    async def stream(book_title, reviews, average_rating):
+        return
+        yield
+
+    monkeypatch.setattr(review_routes.llm_service, "stream_review_summary", stream)
+    await create_reviews(1)
+
+    response = await test_client.get(f"/books/{test_book.id}/summary/stream")
+
+    assert response.status_code == 200
+    assert response.text == "event: end\ndata: {}\n\n"
+    assert not review_routes._summary_cache
+    assert not review_routes._summary_pending
+
+
+async def test_stream_summary_for_nonexistent_book(test_client: AsyncClient):
+    """Test streaming a summary for a non-existent book fails."""
+    response = await test_client.get("/books/999/summary/stream")
+
+    assert response.status_code == 404
+
+
 async def test_update_review(test_client: AsyncClient, test_book, auth_token: str):
     """Test updating a review."""
     # Create review
@@ -161,7 +279,6 @@ async def test_update_review(test_client: AsyncClient, test_book, auth_token: st
     assert data["rating"] == 5.0
 
 
-@pytest.mark.asyncio
 async def test_delete_review(test_client: AsyncClient, test_book, auth_token: str):
     """Test deleting a review."""
     # Create review
@@ -182,3 +299,21 @@ async def test_delete_review(test_client: AsyncClient, test_book, auth_token: st
     )
 
     assert response.status_code == 204
+
+
+async def test_book_detail_includes_review_authors(
+    test_client: AsyncClient, test_book, auth_token: str
+):
+    """Test the book detail endpoint returns reviews with their authors."""
+    await test_client.post(
+        f"/books/{test_book.id}/reviews",
+        json={"review_text": "Great book!", "rating": 4.0},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+
+    response = await test_client.get(f"/books/{test_book.id}")
+
+    assert response.status_code == 200
+    reviews = response.json()["reviews"]
+    assert len(reviews) == 1
+    assert reviews[0]["user"]["username"] == "testuser"
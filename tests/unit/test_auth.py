@@ -7,40 +7,31 @@ and token verification.
 
 import pytest
 from datetime import datetime, timedelta
-from jose import jwt
+import jwt
+from fastapi import HTTPException
 
 from src.auth import (
-    hash_password,
     verify_password,
     create_tokens,
     verify_token,
+    require_role,
 )
 from src.core.config import settings
 
 
-def test_hash_password():
+def test_hash_password(test_password_hash):
     """Test password hashing."""
-    password = "TestPassword123"
-    hashed = hash_password(password)
+    assert test_password_hash != "TestPassword123"
+    assert len(test_password_hash) > 0
 
-    assert hashed != password
-    assert len(hashed) > 0
 
-
-def test_verify_password_correct():
-    """Test password verification with correct password."""
-    password = "TestPassword123"
-    hashed = hash_password(password)
-
-    assert verify_password(password, hashed) is True
-
-
-def test_verify_password_incorrect():
-    """Test password verification with incorrect password."""
-    password = "TestPassword123"
-    hashed = hash_password(password)
-
-    assert verify_password("WrongPassword", hashed) is False
+@pytest.mark.parametrize("password,expected", [
+    ("TestPassword123", True),
+    ("WrongPassword", False),
+])
+def test_verify_password(test_password_hash, password, expected):
+    """Test password verification with correct and incorrect passwords."""
+    assert verify_password(password, test_password_hash) is expected
 
 
 def test_create_tokens():
@@ -69,6 +60,7 @@ def test_verify_token_valid():
     assert payload["sub"] == str(user_id)
     assert payload["username"] == username
     assert payload["role"] == role
+    assert payload["exp"] - payload["iat"] == settings.access_token_expire_minutes * 60
 
 
 def test_verify_token_invalid():
@@ -118,3 +110,35 @@ def test_refresh_token_type():
     payload = verify_token(refresh_token)
 
     assert payload["type"] == "refresh"
+
+
+def test_verify_token_is_cached():
+    """Test that repeated verification of a token is served from the cache."""
+    access_token, _ = create_tokens(7, "cacheuser", "user")
+
+    first = verify_token(access_token)
+    second = verify_token(access_token)
+
+    assert second is first
+
+
+def test_verify_token_invalid_not_cached():
+    """Test that rejected tokens are never cached."""
+    invalid_token = "invalid.token.here"
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            verify_token(invalid_token)
+
+
+async def test_require_role_allows_role_and_admin():
+    """Test that require_role admits the required role and admins only."""
+    check_role = require_role("editor")
+
+    for role in ("editor", "admin"):
+        user = {"sub": "1", "role": role}
+        assert await check_role(current_user=user) is user
+
+    with pytest.raises(HTTPException) as exc_info:
+        await check_role(current_user={"sub": "1", "role": "user"})
+    assert exc_info.value.status_code == 403
@@ -8,11 +8,11 @@ filtering, and searching.
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.services import BookService
-from src.schemas import BookCreate, BookUpdate
+from src.services import BookService, ReviewService
+from src.schemas import BookCreate, BookUpdate, ReviewCreate
+from src.models import User
 
 
-@pytest.mark.asyncio
 async def test_create_book(db_session: AsyncSession):
     """Test creating a new book."""
     book_data = BookCreate(
@@ -32,7 +32,6 @@ async def test_create_book(db_session: AsyncSession):
     assert book.year_published == 1925
 
 
-@pytest.mark.asyncio
 async def test_get_book_by_id(db_session: AsyncSession):
     """Test retrieving a book by ID."""
     book_data = BookCreate(
@@ -51,25 +50,47 @@ async def test_get_book_by_id(db_session: AsyncSession):
     assert retrieved_book.title == "The Great Gatsby"
 
 
-@pytest.mark.asyncio
 async def test_get_nonexistent_book(db_session: AsyncSession):
     """Test retrieving a non-existent book returns None."""
     book = await BookService.get_book_by_id(db_session, 999)
     assert book is None
 
 
-@pytest.mark.asyncio
-async def test_get_all_books(db_session: AsyncSession):
+async def test_get_book_by_id_bare(db_session: AsyncSession):
+    """Test that the bare lookup does not load reviews."""
+    created_book = await BookService.create_book(
+        db_session, BookCreate(title="Dune", author="Frank Herbert", genre="Sci-Fi")
+    )
+    db_session.expunge_all()
+
+    book = await BookService.get_book_by_id_bare(db_session, created_book.id)
+
+    assert book.title == "Dune"
+    assert "reviews" not in book.__dict__
+
+
+async def test_book_exists(db_session: AsyncSession):
+    """Test the existence check for books."""
+    book = await BookService.create_book(
+        db_session, BookCreate(title="Dune", author="Frank Herbert", genre="Sci-Fi")
+    )
+
+    assert await BookService.exists(db_session, book.id) is True
+    assert await BookService.exists(db_session, 999) is False
+
+
+async def test_get_all_books(db_session: AsyncSession, bulk_create_books):
     """Test retrieving all books with pagination."""
     # Create multiple books
-    for i in range(5):
-        book_data = BookCreate(
-            title=f"Book {i}",
-            author=f"Author {i}",
-            genre="Fiction",
-            year_published=2020 + i,
-        )
-        await BookService.create_book(db_session, book_data)
+    await bulk_create_books([
+        {
+            "title": f"Book {i}",
+            "author": f"Author {i}",
+            "genre": "Fiction",
+            "year_published": 2020 + i,
+        }
+        for i in range(5)
+    ])
 
     books, total = await BookService.get_all_books(db_session, skip=0, limit=10)
 
@@ -77,49 +98,48 @@ async def test_get_all_books(db_session: AsyncSession):
     assert total == 5
 
 
-@pytest.mark.asyncio
-async def test_get_books_with_genre_filter(db_session: AsyncSession):
-    """Test retrieving books filtered by genre."""
-    # Create books with different genres
-    for genre in ["Fiction", "Mystery", "Fiction"]:
-        book_data = BookCreate(
-            title=f"Book in {genre}",
-            author="Author",
-            genre=genre,
-        )
-        await BookService.create_book(db_session, book_data)
-
-    books, total = await BookService.get_all_books(
-        db_session, skip=0, limit=10, genre="Fiction"
-    )
+async def test_get_all_books_pagination_total(db_session: AsyncSession, bulk_create_books):
+    """Test that the total is reported on partial and past-the-end pages."""
+    await bulk_create_books([
+        {"title": f"Book {i}", "author": f"Author {i}", "genre": "Fiction"}
+        for i in range(5)
+    ])
 
+    books, total = await BookService.get_all_books(db_session, skip=3, limit=10)
     assert len(books) == 2
-    assert total == 2
-    assert all(book.genre == "Fiction" for book in books)
+    assert total == 5
+
+    books, total = await BookService.get_all_books(db_session, skip=10, limit=10)
+    assert books == []
+    assert total == 5
 
 
-@pytest.mark.asyncio
-async def test_get_books_with_author_filter(db_session: AsyncSession):
-    """Test retrieving books filtered by author."""
-    # Create books by different authors
-    for author in ["Author A", "Author B", "Author A"]:
-        book_data = BookCreate(
-            title="Book Title",
-            author=author,
-            genre="Fiction",
-        )
-        await BookService.create_book(db_session, book_data)
+@pytest.mark.parametrize("field,value", [
+    ("genre", "Fiction"),
+    ("author", "Author A"),
+])
+async def test_get_books_with_filter(db_session: AsyncSession, bulk_create_books, field, value):
+    """Test retrieving books filtered by genre or author."""
+    # Two books match each filter, and they differ between filters
+    await bulk_create_books([
+        {"title": f"Book {i}", "author": author, "genre": genre}
+        for i, (genre, author) in enumerate([
+            ("Fiction", "Author A"),
+            ("Mystery", "Author B"),
+            ("Fiction", "Author B"),
+            ("Sci-Fi", "Author A"),
+        ])
+    ])
 
     books, total = await BookService.get_all_books(
-        db_session, skip=0, limit=10, author="Author A"
+        db_session, skip=0, limit=10, **{field: value}
     )
 
     assert len(books) == 2
     assert total == 2
-    assert all(book.author == "Author A" for book in books)
+    assert all(getattr(book, field) == value for book in books)
 
 
-@pytest.mark.asyncio
 async def test_update_book(db_session: AsyncSession):
     """Test updating a book."""
     book_data = BookCreate(
@@ -145,7 +165,6 @@ async def test_update_book(db_session: AsyncSession):
     assert updated_book.genre == "Fiction"  # Unchanged
 
 
-@pytest.mark.asyncio
 async def test_update_nonexistent_book(db_session: AsyncSession):
     """Test updating a non-existent book returns None."""
     update_data = BookUpdate(title="Updated Title")
@@ -153,7 +172,40 @@ async def test_update_nonexistent_book(db_session: AsyncSession):
     assert updated_book is None
 
 
-@pytest.mark.asyncio
+async def test_update_book_without_fields(db_session: AsyncSession):
+    """Test that an empty update returns the book unchanged."""
+    created_book = await BookService.create_book(
+        db_session, BookCreate(title="Dune", author="Frank Herbert", genre="Sci-Fi")
+    )
+
+    updated_book = await BookService.update_book(db_session, created_book.id, BookUpdate())
+
+    assert updated_book.id == created_book.id
+    assert updated_book.title == "Dune"
+
+
+async def test_update_book_rating_with_and_without_fields(
+    db_session: AsyncSession, test_book, test_password_hash
+):
+    """Test that empty and real updates return the same stored rating."""
+    user = User(username="reader", email="reader@example.com", hashed_password=test_password_hash)
+    db_session.add(user)
+    await db_session.commit()
+    await ReviewService.create_review(
+        db_session, test_book.id, user.id, ReviewCreate(review_text="Good", rating=4.0)
+    )
+    db_session.expunge_all()
+
+    unchanged = await BookService.update_book(db_session, test_book.id, BookUpdate())
+    assert unchanged.average_rating == 4.0
+
+    db_session.expunge_all()
+    updated = await BookService.update_book(
+        db_session, test_book.id, BookUpdate(title="Renamed")
+    )
+    assert updated.average_rating == 4.0
+
+
 async def test_delete_book(db_session: AsyncSession):
     """Test deleting a book."""
     book_data = BookCreate(
@@ -171,14 +223,12 @@ async def test_delete_book(db_session: AsyncSession):
     assert deleted_book is None
 
 
-@pytest.mark.asyncio
 async def test_delete_nonexistent_book(db_session: AsyncSession):
     """Test deleting a non-existent book returns False."""
     success = await BookService.delete_book(db_session, 999)
     assert success is False
 
 
-@pytest.mark.asyncio
 async def test_search_books_by_title(db_session: AsyncSession):
     """Test searching books by title."""
     # Create books
@@ -203,7 +253,6 @@ async def test_search_books_by_title(db_session: AsyncSession):
     assert books[0].title == "The Great Gatsby"
 
 
-@pytest.mark.asyncio
 async def test_search_books_by_author(db_session: AsyncSession):
     """Test searching books by author."""
     # Create books
@@ -0,0 +1,35 @@
+"""
+Unit tests for the CORS configuration.
+
+This module tests which origins the configured
+CORS middleware allows.
+"""
+
+import pytest
+from starlette.middleware.cors import CORSMiddleware
+
+from src.main import _cors_origin_options
+
+
+def cors_middleware(origins: list) -> CORSMiddleware:
+    """Build the middleware the app would install for ``origins``."""
+    return CORSMiddleware(app=None, **_cors_origin_options(origins))
+
+
+@pytest.mark.parametrize("origin", [
+    "http://localhost:3000",
+    "https://example.com",
+])
+def test_wildcard_allows_any_origin(origin):
+    """Test that CORS_ORIGINS=* allows every origin."""
+    assert cors_middleware(["*"]).is_allowed_origin(origin)
+
+
+def test_listed_origins_match_exactly():
+    """Test that listed origins are matched literally and in full."""
+    middleware = cors_middleware(["http://localhost:3000", "https://app.example.com"])
+
+    assert middleware.is_allowed_origin("http://localhost:3000")
+    assert middleware.is_allowed_origin("https://app.example.com")
+    assert not middleware.is_allowed_origin("http://localhost:3000.evil.com")
+    assert not middleware.is_allowed_origin("https://appXexample.com")
@@ -0,0 +1,108 @@
+"""
+Unit tests for the LLM service.
+
+This module tests completion caching and error handling
+against a stubbed Groq client.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.utils import llm as llm_module
+from src.utils.llm import LLMService
+
+
+def completion(text: str) -> SimpleNamespace:
+    """Build a chat completion response carrying ``text``."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """LLM service whose Groq client is a stub with an AsyncMock ``create``."""
+    service = LLMService()
+    create = AsyncMock(return_value=completion("  A short summary.  "))
+    monkeypatch.setattr(
+        service, "client", SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    )
+    return service
+
+
+class _BlockingStream:
+    """Streaming response stand-in that yields once ``release`` is set."""
+
+    def __init__(self, release: asyncio.Event, open_streams: list):
+        self.release = release
+        self.open_streams = open_streams
+        self.response = SimpleNamespace(aclose=self.aclose)
+        open_streams.append(self)
+
+    async def aclose(self):
+        self.open_streams.remove(self)
+
+    async def __aiter__(self):
+        await self.release.wait()
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Done."))])
+
+
+async def test_generate_summary_is_cached(llm):
+    """Test a repeated summary prompt is served from the cache."""
+    first = await llm.generate_summary("Dune", "Frank Herbert", "Spice.")
+    second = await llm.generate_summary("Dune", "Frank Herbert", "Spice.")
+
+    assert first == second == "A short summary."
+    assert llm.client.chat.completions.create.await_count == 1
+
+
+async def test_generate_summary_failure_is_not_cached(llm):
+    """Test a failed completion raises RuntimeError and is retried next time."""
+    create = llm.client.chat.completions.create
+    create.side_effect = [ValueError("boom"), completion("Recovered.")]
+
+    with pytest.raises(RuntimeError, match="Failed to generate summary: boom"):
+        await llm.generate_summary("Dune", "Frank Herbert", "Spice.")
+
+    assert await llm.generate_summary("Dune", "Frank Herbert", "Spice.") == "Recovered."
+    assert create.await_count == 2
+
+
+async def test_disabled_service_raises(monkeypatch):
+    """Test calls fail clearly when no Groq client is configured."""
+    service = LLMService()
+    monkeypatch.setattr(service, "client", None)
+
+    with pytest.raises(RuntimeError, match="not configured"):
+        await service.generate_summary("Dune", "Frank Herbert", "Spice.")
+
+
+async def test_open_streams_are_bounded(llm, monkeypatch):
+    """Test streams hold a concurrency slot until they are closed."""
+    monkeypatch.setattr(llm_module, "_llm_sem", asyncio.Semaphore(2))
+    release = asyncio.Event()
+    open_streams = []
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal peak
+        stream = _BlockingStream(release, open_streams)
+        peak = max(peak, len(open_streams))
+        return stream
+
+    llm.client.chat.completions.create = create
+
+    async def consume():
+        return [fragment async for fragment in llm.stream_summary("Dune", "Frank Herbert", "Spice.")]
+
+    tasks = [asyncio.create_task(consume()) for _ in range(5)]
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert len(open_streams) == 2
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [["Done."]] * 5
+    assert peak == 2
+    assert open_streams == []
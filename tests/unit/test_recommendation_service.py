@@ -0,0 +1,154 @@
+"""
+Unit tests for the Recommendation service.
+
+This module tests genre, popularity and LLM-assisted
+book recommendations.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.services import BookService, RecommendationService, ReviewService, UserService
+from src.services import recommendation_service
+from src.schemas import BookCreate, ReviewCreate, ReviewUpdate, UserCreate
+from src.models import Review, User
+
+
+@pytest.fixture
+async def test_books(bulk_create_books):
+    """Create test books."""
+    return await bulk_create_books([
+        {"title": f"Book {i}", "author": "Test Author", "genre": genre}
+        for i, genre in enumerate(["Fiction", "Fiction", "Mystery", "Sci-Fi"])
+    ])
+
+
+async def test_llm_recommendations_prefer_named_books(
+    db_session: AsyncSession, test_books, monkeypatch
+):
+    """Test books the LLM names come first, then candidates in ID order."""
+    named = test_books[2]
+    generate = AsyncMock(return_value=f"1. ID:{named.id} is a great fit.")
+    monkeypatch.setattr(recommendation_service.llm_service, "client", object())
+    monkeypatch.setattr(
+        recommendation_service.llm_service, "generate_recommendations", generate
+    )
+
+    books, reasoning = await RecommendationService.get_recommendations_with_llm(
+        db_session, "I like mysteries", limit=2
+    )
+
+    assert [book.id for book in books] == [named.id, test_books[0].id]
+    assert reasoning == f"1. ID:{named.id} is a great fit."
+
+
+async def test_llm_recommendations_ignore_unknown_ids(
+    db_session: AsyncSession, test_books, monkeypatch
+):
+    """Test IDs outside the candidate set are ignored."""
+    generate = AsyncMock(return_value="ID:9999 does not exist.")
+    monkeypatch.setattr(recommendation_service.llm_service, "client", object())
+    monkeypatch.setattr(
+        recommendation_service.llm_service, "generate_recommendations", generate
+    )
+
+    books, _ = await RecommendationService.get_recommendations_with_llm(
+        db_session, "Anything", limit=3
+    )
+
+    assert [book.id for book in books] == [book.id for book in test_books[:3]]
+
+
+async def test_llm_recommendations_disabled_use_popular_books(
+    db_session: AsyncSession, test_books, test_password_hash, monkeypatch
+):
+    """Test popular books are returned without an LLM call when it is disabled."""
+    users = [
+        User(username=f"reader{i}", email=f"reader{i}@example.com", hashed_password=test_password_hash)
+        for i in range(2)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    # Two reviews each, so both books qualify as popular
+    db_session.add_all(
+        Review(book_id=book.id, user_id=user.id, review_text="Read it", rating=rating)
+        for book, ratings in ((test_books[0], (3.0, 4.0)), (test_books[1], (5.0, 4.0)))
+        for user, rating in zip(users, ratings)
+    )
+    await db_session.flush()
+    await ReviewService.refresh_book_ratings(db_session, [test_books[0].id, test_books[1].id])
+    await db_session.commit()
+
+    generate = AsyncMock()
+    monkeypatch.setattr(recommendation_service.llm_service, "client", None)
+    monkeypatch.setattr(
+        recommendation_service.llm_service, "generate_recommendations", generate
+    )
+
+    books, reasoning = await RecommendationService.get_recommendations_with_llm(
+        db_session, "I like mysteries", limit=2
+    )
+
+    assert [book.id for book in books] == [test_books[1].id, test_books[0].id]
+    assert reasoning == ""
+    generate.assert_not_awaited()
+
+
+async def test_user_recommendations_alternate_favorite_genres(
+    db_session: AsyncSession, test_books
+):
+    """Test recommendations draw from each positively reviewed genre in turn."""
+    user = await UserService.create_user(
+        db_session,
+        UserCreate(username="reader", email="reader@example.com", password="TestPassword123"),
+    )
+    extra = await BookService.create_book(
+        db_session, BookCreate(title="Book 4", author="Test Author", genre="Fiction")
+    )
+    # Fiction and Mystery are liked, Sci-Fi is not
+    for book, rating in ((test_books[0], 5.0), (test_books[2], 4.0), (test_books[3], 2.0)):
+        await ReviewService.create_review(
+            db_session, book.id, user.id, ReviewCreate(review_text="Read it", rating=rating)
+        )
+
+    books = await RecommendationService.get_user_recommendations(
+        db_session, user.id, limit=3
+    )
+
+    assert [book.id for book in books] == [
+        test_books[0].id, test_books[2].id, test_books[1].id,
+    ]
+    assert extra.id not in {book.id for book in books}
+
+
+async def test_popular_books_follow_review_changes(db_session: AsyncSession, test_books):
+    """Test popular books are ranked on stats kept current by review writes."""
+    users = [
+        await UserService.create_user(
+            db_session,
+            UserCreate(username=f"reader{i}", email=f"reader{i}@example.com", password="TestPassword123"),
+        )
+        for i in range(2)
+    ]
+    reviews = {}
+    for book, ratings in ((test_books[0], (3.0, 4.0)), (test_books[1], (5.0, 4.0)), (test_books[2], (5.0,))):
+        for user, rating in zip(users, ratings):
+            reviews[book.id, user.id] = await ReviewService.create_review(
+                db_session, book.id, user.id, ReviewCreate(review_text="Read it", rating=rating)
+            )
+
+    db_session.expunge_all()
+    books = await RecommendationService.get_popular_books(db_session, limit=5)
+    assert [(book.id, book.average_rating) for book in books] == [
+        (test_books[1].id, 4.5), (test_books[0].id, 3.5),
+    ]
+
+    await ReviewService.update_review(
+        db_session, reviews[test_books[0].id, users[0].id].id, ReviewUpdate(rating=5.0)
+    )
+    await ReviewService.delete_review(db_session, reviews[test_books[1].id, users[1].id].id)
+
+    db_session.expunge_all()
+    books = await RecommendationService.get_popular_books(db_session, limit=5)
+    assert [(book.id, book.average_rating) for book in books] == [(test_books[0].id, 4.5)]
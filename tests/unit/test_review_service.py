@@ -8,33 +8,42 @@ updating, and deletion operations.
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.services import ReviewService, UserService, BookService
-from src.schemas import ReviewCreate, ReviewUpdate, UserCreate, BookCreate
+from src.services import ReviewService, BookService
+from src.schemas import ReviewCreate, ReviewUpdate
+from src.models import Review, User
 
 
 @pytest.fixture
-async def test_user(db_session: AsyncSession):
-    """Create a test user."""
-    user_data = UserCreate(
+async def test_user(db_session: AsyncSession, test_password_hash):
+    """Create a test user, reusing the session's password hash."""
+    user = User(
         username="testuser",
         email="test@example.com",
-        password="TestPassword123",
+        hashed_password=test_password_hash,
     )
-    return await UserService.create_user(db_session, user_data)
+    db_session.add(user)
+    await db_session.commit()
+    return user
 
 
 @pytest.fixture
-async def test_book(db_session: AsyncSession):
-    """Create a test book."""
-    book_data = BookCreate(
-        title="Test Book",
-        author="Test Author",
-        genre="Fiction",
-    )
-    return await BookService.create_book(db_session, book_data)
+def create_reviews(db_session: AsyncSession, test_user, test_book):
+    """Return a helper that inserts reviews of the test book in one commit."""
+    async def create(count: int) -> None:
+        db_session.add_all(
+            Review(
+                book_id=test_book.id,
+                user_id=test_user.id,
+                review_text=f"Review {i}",
+                rating=3.0 + i,
+            )
+            for i in range(count)
+        )
+        await db_session.commit()
+
+    return create
 
 
-@pytest.mark.asyncio
 async def test_create_review(db_session: AsyncSession, test_user, test_book):
     """Test creating a new review."""
     review_data = ReviewCreate(
@@ -53,7 +62,6 @@ async def test_create_review(db_session: AsyncSession, test_user, test_book):
     assert review.rating == 4.5
 
 
-@pytest.mark.asyncio
 async def test_get_review_by_id(db_session: AsyncSession, test_user, test_book):
     """Test retrieving a review by ID."""
     review_data = ReviewCreate(
@@ -73,18 +81,10 @@ async def test_get_review_by_id(db_session: AsyncSession, test_user, test_book):
     assert retrieved_review.review_text == "This is a great book!"
 
 
-@pytest.mark.asyncio
-async def test_get_reviews_by_book(db_session: AsyncSession, test_user, test_book):
+async def test_get_reviews_by_book(db_session: AsyncSession, test_book, create_reviews):
     """Test retrieving reviews for a book."""
     # Create multiple reviews
-    for i in range(3):
-        review_data = ReviewCreate(
-            review_text=f"Review {i}",
-            rating=3.0 + i,
-        )
-        await ReviewService.create_review(
-            db_session, test_book.id, test_user.id, review_data
-        )
+    await create_reviews(3)
 
     reviews, total = await ReviewService.get_reviews_by_book(
         db_session, test_book.id, skip=0, limit=10
@@ -94,18 +94,27 @@ async def test_get_reviews_by_book(db_session: AsyncSession, test_user, test_boo
     assert total == 3
 
 
-@pytest.mark.asyncio
-async def test_get_reviews_by_user(db_session: AsyncSession, test_user, test_book):
+async def test_get_reviews_by_book_pages(db_session: AsyncSession, test_book, create_reviews):
+    """Test the total is reported for partial pages and pages past the end."""
+    await create_reviews(3)
+
+    reviews, total = await ReviewService.get_reviews_by_book(
+        db_session, test_book.id, skip=2, limit=2
+    )
+    assert len(reviews) == 1
+    assert total == 3
+
+    reviews, total = await ReviewService.get_reviews_by_book(
+        db_session, test_book.id, skip=5, limit=2
+    )
+    assert reviews == []
+    assert total == 3
+
+
+async def test_get_reviews_by_user(db_session: AsyncSession, test_user, create_reviews):
     """Test retrieving reviews by a user."""
     # Create multiple reviews by the same user
-    for i in range(3):
-        review_data = ReviewCreate(
-            review_text=f"Review {i}",
-            rating=3.0 + i,
-        )
-        await ReviewService.create_review(
-            db_session, test_book.id, test_user.id, review_data
-        )
+    await create_reviews(3)
 
     reviews, total = await ReviewService.get_reviews_by_user(
         db_session, test_user.id, skip=0, limit=10
@@ -115,7 +124,6 @@ async def test_get_reviews_by_user(db_session: AsyncSession, test_user, test_boo
     assert total == 3
 
 
-@pytest.mark.asyncio
 async def test_update_review(db_session: AsyncSession, test_user, test_book):
     """Test updating a review."""
     review_data = ReviewCreate(
@@ -141,7 +149,6 @@ async def test_update_review(db_session: AsyncSession, test_user, test_book):
     assert updated_review.rating == 5.0
 
 
-@pytest.mark.asyncio
 async def test_delete_review(db_session: AsyncSession, test_user, test_book):
     """Test deleting a review."""
     review_data = ReviewCreate(
@@ -162,19 +169,20 @@ async def test_delete_review(db_session: AsyncSession, test_user, test_book):
     assert deleted_review is None
 
 
-@pytest.mark.asyncio
 async def test_get_book_rating_summary(db_session: AsyncSession, test_user, test_book):
     """Test getting book rating summary."""
     # Create multiple reviews with different ratings
     ratings = [3.0, 4.0, 5.0, 4.5]
-    for rating in ratings:
-        review_data = ReviewCreate(
+    db_session.add_all(
+        Review(
+            book_id=test_book.id,
+            user_id=test_user.id,
             review_text=f"Review with rating {rating}",
             rating=rating,
         )
-        await ReviewService.create_review(
-            db_session, test_book.id, test_user.id, review_data
-        )
+        for rating in ratings
+    )
+    await db_session.commit()
 
     avg_rating, total_reviews = await ReviewService.get_book_rating_summary(
         db_session, test_book.id
@@ -184,7 +192,6 @@ async def test_get_book_rating_summary(db_session: AsyncSession, test_user, test
     assert abs(avg_rating - 4.125) < 0.01  # Average of ratings
 
 
-@pytest.mark.asyncio
 async def test_get_rating_summary_no_reviews(db_session: AsyncSession, test_book):
     """Test getting rating summary for book with no reviews."""
     avg_rating, total_reviews = await ReviewService.get_book_rating_summary(
@@ -193,3 +200,47 @@ async def test_get_rating_summary_no_reviews(db_session: AsyncSession, test_book
 
     assert avg_rating == 0.0
     assert total_reviews == 0
+
+
+async def test_book_average_rating(db_session: AsyncSession, test_user, test_book):
+    """Test that a book's average rating is computed from its reviews."""
+    assert test_book.average_rating is None
+
+    for rating in (4.0, 5.0, 5.0):
+        await ReviewService.create_review(
+            db_session, test_book.id, test_user.id,
+            ReviewCreate(review_text="Rated", rating=rating),
+        )
+
+    db_session.expunge_all()
+    books, _ = await BookService.get_all_books(db_session)
+    assert books[0].average_rating == 4.67
+
+    db_session.expunge_all()
+    book = await BookService.get_book_by_id(db_session, test_book.id)
+    assert book.average_rating == 4.67
+
+
+async def test_get_recent_review_texts(db_session: AsyncSession, test_book, create_reviews):
+    """Test fetching only the texts of a book's recent reviews."""
+    await create_reviews(3)
+
+    texts = await ReviewService.get_recent_review_texts(db_session, test_book.id, limit=2)
+
+    assert len(texts) == 2
+    assert all(text.startswith("Review ") for text in texts)
+
+
+async def test_delete_book_removes_reviews(db_session: AsyncSession, test_user, test_book):
+    """Test deleting a book removes its reviews through the foreign key cascade."""
+    review = await ReviewService.create_review(
+        db_session, test_book.id, test_user.id,
+        ReviewCreate(review_text="Soon gone", rating=3.0),
+    )
+    review_id = review.id
+    db_session.expunge_all()
+
+    assert await BookService.delete_book(db_session, test_book.id) is True
+
+    db_session.expunge_all()
+    assert await ReviewService.get_review_by_id(db_session, review_id) is None
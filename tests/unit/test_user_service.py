@@ -6,57 +6,74 @@ and retrieval operations.
 """
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.services import UserService
-from src.schemas import UserCreate
+from src.services import BookService, ReviewService, UserService
+from src.schemas import ReviewCreate, UserCreate
 from src.auth import verify_password
+from src.models import User
+
+# Validated once; create_user only reads it
+TEST_USER = UserCreate(
+    username="testuser",
+    email="test@example.com",
+    password="TestPassword123",
+)
+
+
+@pytest.fixture
+def create_users(db_session: AsyncSession, test_password_hash):
+    """Return a helper that inserts users in one commit, sharing one password hash."""
+    async def create(count: int) -> list[User]:
+        users = [
+            User(
+                username=f"testuser{i}",
+                email=f"test{i}@example.com",
+                hashed_password=test_password_hash,
+            )
+            for i in range(count)
+        ]
+        db_session.add_all(users)
+        await db_session.commit()
+        return users
+
+    return create
 
 
-@pytest.mark.asyncio
 async def test_create_user(db_session: AsyncSession):
     """Test creating a new user."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-
-    user = await UserService.create_user(db_session, user_data)
+    user = await UserService.create_user(db_session, TEST_USER)
 
     assert user.id is not None
     assert user.username == "testuser"
     assert user.email == "test@example.com"
     assert verify_password("TestPassword123", user.hashed_password)
-    assert user.is_active == 1
+    assert user.is_active is True
+    assert user.role == "user"
+
+
+async def test_invalid_role_rejected(db_session: AsyncSession):
+    """Test that the database rejects roles outside the known set."""
+    user = await UserService.create_user(db_session, TEST_USER)
+    user.role = "superuser"
+
+    with pytest.raises(IntegrityError):
+        await db_session.commit()
 
 
-@pytest.mark.asyncio
 async def test_create_duplicate_user(db_session: AsyncSession):
     """Test that creating a duplicate user raises an error."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-
-    await UserService.create_user(db_session, user_data)
+    await UserService.create_user(db_session, TEST_USER)
 
     # Try to create with same username
     with pytest.raises(ValueError):
-        await UserService.create_user(db_session, user_data)
+        await UserService.create_user(db_session, TEST_USER)
 
 
-@pytest.mark.asyncio
 async def test_get_user_by_id(db_session: AsyncSession):
     """Test retrieving a user by ID."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-
-    created_user = await UserService.create_user(db_session, user_data)
+    created_user = await UserService.create_user(db_session, TEST_USER)
     retrieved_user = await UserService.get_user_by_id(db_session, created_user.id)
 
     assert retrieved_user is not None
@@ -64,23 +81,29 @@ async def test_get_user_by_id(db_session: AsyncSession):
     assert retrieved_user.username == "testuser"
 
 
-@pytest.mark.asyncio
+async def test_get_user_by_id_sees_changes(db_session: AsyncSession, test_sessionmaker):
+    """Test that a lookup in a new session reflects changes made elsewhere."""
+    created_user = await UserService.create_user(db_session, TEST_USER)
+    assert (await UserService.get_user_by_id(db_session, created_user.id)).is_active
+
+    created_user.is_active = False
+    await db_session.commit()
+
+    async with test_sessionmaker() as other_session:
+        user = await UserService.get_user_by_id(other_session, created_user.id)
+        assert user is not created_user
+        assert user.is_active is False
+
+
 async def test_get_nonexistent_user(db_session: AsyncSession):
     """Test retrieving a non-existent user returns None."""
     user = await UserService.get_user_by_id(db_session, 999)
     assert user is None
 
 
-@pytest.mark.asyncio
 async def test_get_user_by_username(db_session: AsyncSession):
     """Test retrieving a user by username."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-
-    created_user = await UserService.create_user(db_session, user_data)
+    created_user = await UserService.create_user(db_session, TEST_USER)
     retrieved_user = await UserService.get_user_by_username(db_session, "testuser")
 
     assert retrieved_user is not None
@@ -88,16 +111,9 @@ async def test_get_user_by_username(db_session: AsyncSession):
     assert retrieved_user.username == "testuser"
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_success(db_session: AsyncSession):
     """Test successful user authentication."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-
-    await UserService.create_user(db_session, user_data)
+    await UserService.create_user(db_session, TEST_USER)
     user, tokens = await UserService.authenticate_user(
         db_session, "testuser", "TestPassword123"
     )
@@ -108,25 +124,31 @@ async def test_authenticate_user_success(db_session: AsyncSession):
     assert len(tokens) == 2  # access_token and refresh_token
 
 
-@pytest.mark.asyncio
 async def test_authenticate_user_wrong_password(db_session: AsyncSession):
     """Test authentication with wrong password."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
+    await UserService.create_user(db_session, TEST_USER)
+    user, tokens = await UserService.authenticate_user(
+        db_session, "testuser", "WrongPassword"
     )
 
-    await UserService.create_user(db_session, user_data)
+    assert user is None
+    assert tokens is None
+
+
+async def test_authenticate_inactive_user(db_session: AsyncSession):
+    """Test that inactive users cannot authenticate."""
+    created_user = await UserService.create_user(db_session, TEST_USER)
+    created_user.is_active = False
+    await db_session.commit()
+
     user, tokens = await UserService.authenticate_user(
-        db_session, "testuser", "WrongPassword"
+        db_session, "testuser", "TestPassword123"
     )
 
     assert user is None
     assert tokens is None
 
 
-@pytest.mark.asyncio
 async def test_authenticate_nonexistent_user(db_session: AsyncSession):
     """Test authentication of non-existent user."""
     user, tokens = await UserService.authenticate_user(
@@ -137,17 +159,10 @@ async def test_authenticate_nonexistent_user(db_session: AsyncSession):
     assert tokens is None
 
 
-@pytest.mark.asyncio
-async def test_get_all_users(db_session: AsyncSession):
+async def test_get_all_users(db_session: AsyncSession, create_users):
     """Test retrieving all users with pagination."""
     # Create multiple users
-    for i in range(5):
-        user_data = UserCreate(
-            username=f"testuser{i}",
-            email=f"test{i}@example.com",
-            password="TestPassword123",
-        )
-        await UserService.create_user(db_session, user_data)
+    await create_users(5)
 
     users, total = await UserService.get_all_users(db_session, skip=0, limit=10)
 
@@ -155,16 +170,19 @@ async def test_get_all_users(db_session: AsyncSession):
     assert total == 5
 
 
-@pytest.mark.asyncio
+async def test_get_all_users_total_counts_beyond_page(db_session: AsyncSession, create_users):
+    """Test the total counts every user, not just the returned page."""
+    await create_users(3)
+
+    users, total = await UserService.get_all_users(db_session, skip=1, limit=1)
+
+    assert len(users) == 1
+    assert total == 3
+
+
 async def test_delete_user(db_session: AsyncSession):
     """Test deleting a user."""
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="TestPassword123",
-    )
-
-    created_user = await UserService.create_user(db_session, user_data)
+    created_user = await UserService.create_user(db_session, TEST_USER)
     success = await UserService.delete_user(db_session, created_user.id)
 
     assert success is True
@@ -173,7 +191,29 @@ async def test_delete_user(db_session: AsyncSession):
     assert deleted_user is None
 
 
-@pytest.mark.asyncio
+async def test_delete_user_refreshes_book_ratings(
+    db_session: AsyncSession, create_users, bulk_create_books
+):
+    """Test deleting a user recomputes the ratings of the books they reviewed."""
+    leaving, staying = await create_users(2)
+    shared, solo = await bulk_create_books([
+        {"title": f"Book {i}", "author": "Author", "genre": "Fiction"}
+        for i in range(2)
+    ])
+    for book, user, rating in ((shared, leaving, 5.0), (shared, staying, 3.0), (solo, leaving, 4.0)):
+        await ReviewService.create_review(
+            db_session, book.id, user.id, ReviewCreate(review_text="Read it", rating=rating)
+        )
+
+    assert await UserService.delete_user(db_session, leaving.id) is True
+
+    db_session.expunge_all()
+    shared_book = await BookService.get_book_by_id_bare(db_session, shared.id)
+    solo_book = await BookService.get_book_by_id_bare(db_session, solo.id)
+    assert (shared_book.average_rating, shared_book.review_count) == (3.0, 1)
+    assert (solo_book.average_rating, solo_book.review_count) == (None, 0)
+
+
 async def test_delete_nonexistent_user(db_session: AsyncSession):
     """Test deleting a non-existent user returns False."""
     success = await UserService.delete_user(db_session, 999)